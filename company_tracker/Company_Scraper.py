@@ -5,7 +5,7 @@ Company Scraper - Collect company lists from various sources
 
 import json
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 import time
 from fake_useragent import UserAgent
@@ -15,6 +15,18 @@ import os
 # Load environment variables from .env file
 load_dotenv('../linkedin_scraper/.env')
 
+# lxml (C) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Each page only needs one kind of element; strainers skip building the rest of the tree
+FORBES_NAME_STRAINER = SoupStrainer('div', attrs={'class': 'row-cell-value nameField'})
+YC_NAME_STRAINER = SoupStrainer('span', attrs={'class': 'text-2xl'})
+GLASSDOOR_NAME_STRAINER = SoupStrainer('div', attrs={'data-test': 'employer-short-name'})
+
 def get_cb_insights():
     """Get CB Insights AI 100 2025 and Fintech 100 2024 companies"""
     
@@ -51,7 +63,7 @@ def get_forbes_ai50():
     url = 'https://www.forbes.com/lists/ai50/'
     
     response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=FORBES_NAME_STRAINER)
     
     # Find company name elements with correct class
     company_elements = soup.find_all('div', class_='row-cell-value nameField')
@@ -72,7 +84,7 @@ def get_yc_companies():
         response = requests.get(url)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=YC_NAME_STRAINER)
         
         # Look for company names using the correct selector
         # Based on the search results, companies are in spans with class="text-2xl"
@@ -284,7 +296,7 @@ def get_glassdoor_companies():
                     print(f"❌ HTTP Error: {response.status_code}")
                     break
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=GLASSDOOR_NAME_STRAINER)
                 company_elements = soup.find_all('div', {'data-test': 'employer-short-name'})
                 print(f"Found {len(company_elements)} company elements", end=" ")
                 
@@ -19,6 +19,11 @@ import re
 from datetime import datetime
 from typing import Optional
 
+try:
+    import orjson  # several times faster than json for the full company database
+except ImportError:
+    orjson = None
+
 from .tier_config import (
     TIER_THRESHOLDS,
     TIER_LABELS,
@@ -45,14 +50,23 @@ DB_PATH = os.path.join(os.path.dirname(__file__), "company_database.json")
 def _load_db() -> dict:
     if os.path.exists(DB_PATH):
         try:
+            if orjson is not None:
+                with open(DB_PATH, "rb") as f:
+                    return orjson.loads(f.read())
             with open(DB_PATH, "r") as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError):
+        except (ValueError, IOError):  # orjson.JSONDecodeError and json.JSONDecodeError are ValueErrors
             pass
     return {}
 
 
 def _save_db(db: dict):
+    if orjson is not None:
+        with open(DB_PATH, "wb") as f:
+            # Same output as the json fallback: int keys become strings, datetimes go through str()
+            f.write(orjson.dumps(db, default=str, option=orjson.OPT_INDENT_2
+                                 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME))
+        return
     with open(DB_PATH, "w") as f:
         json.dump(db, f, indent=2, default=str)
 
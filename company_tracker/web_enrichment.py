@@ -20,6 +20,13 @@ from typing import Optional
 import requests
 from bs4 import BeautifulSoup
 
+# lxml (C) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 
 # ---------------------------------------------------------------------------
 # Cache layer — avoid repeated scraping for the same company
@@ -173,7 +180,7 @@ def enrich_from_wikipedia(company_name: str) -> dict:
         return result
 
     html = parse_resp.json().get("parse", {}).get("text", {}).get("*", "")
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     # Extract infobox fields
     infobox = soup.find("table", class_="infobox")
@@ -241,7 +248,7 @@ def enrich_from_crunchbase(company_name: str) -> dict:
     if not resp:
         return result
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, HTML_PARSER)
 
     # Look for funding info in the page
     page_text = soup.get_text(" ", strip=True)
@@ -17,7 +17,7 @@ import uuid
 from datetime import datetime, timezone
 import traceback
 from mangum import Mangum
-from simple_api import app, run_analytics_task
+from simple_api import app, run_analytics_task, ANALYTICS_FILE
 
 # Create FastAPI handler for HTTP requests
 mangum_handler = Mangum(app, lifespan="off")
@@ -74,10 +74,32 @@ def is_scheduled_event(event: dict) -> bool:
     
     return False
 
+def upload_jobs_file(path: str, name: str):
+    """Upload the container's jobs file to today's hourly S3 prefix when JOBS_BUCKET is set."""
+    if not JOBS_BUCKET:
+        return
+    try:
+        import boto3
+        import zstandard
+        s3_client = boto3.client("s3")
+        s3_key = f"jobs/hourly/{datetime.now(timezone.utc).date()}/{name}.ndjson.zst"
+        with open(path, "rb") as f:
+            compressed = zstandard.ZstdCompressor(level=3).compress(f.read())
+        s3_client.put_object(
+            Bucket=JOBS_BUCKET,
+            Key=s3_key,
+            Body=compressed,
+            ContentType="application/x-ndjson",
+            ContentEncoding="zstd",
+        )
+        print(f"📦 Uploaded to s3://{JOBS_BUCKET}/{s3_key}")
+    except Exception as s3_err:
+        print(f"⚠️ S3 upload failed: {s3_err}")
+
 async def run_scheduled_scraping(batch_number: int, batch_size: int, job_id: str):
     """Run batch scraping task and optionally upload results to S3."""
     print(f"🚀 Running batch {batch_number}/{batch_size} | job_id={job_id}")
-    tmp_path = "/tmp/analytics_historical_jobs.json"
+    tmp_path = ANALYTICS_FILE
 
     try:
         # Execute analytics task with environment-driven parameters
@@ -95,15 +117,7 @@ async def run_scheduled_scraping(batch_number: int, batch_size: int, job_id: str
         )
 
         # Optional: Upload result file to S3
-        if JOBS_BUCKET:
-            try:
-                import boto3
-                s3_client = boto3.client("s3")
-                s3_key = f"jobs/hourly/{datetime.now(timezone.utc).date()}/batch_{batch_number}.json"
-                s3_client.upload_file(tmp_path, JOBS_BUCKET, s3_key)
-                print(f"📦 Uploaded to s3://{JOBS_BUCKET}/{s3_key}")
-            except Exception as s3_err:
-                print(f"⚠️ S3 upload failed: {s3_err}")
+        upload_jobs_file(tmp_path, f"batch_{batch_number}")
 
         print(f"✅ Scheduled scraping completed - Batch {batch_number}")
         return {
@@ -144,6 +158,17 @@ def handler(event, context):
     except Exception:
         pass
 
+    if isinstance(event, dict) and "scrape_job" in event:
+        # Scrape queued by POST /scrape (async self-invocation)
+        task_kwargs = event["scrape_job"]
+        print(f"📨 Queued scrape job {task_kwargs.get('job_id')}")
+        asyncio.run(run_analytics_task(**task_kwargs))
+        # This container's /tmp is invisible to the API, so publish the results like a scheduled batch
+        jobs_file = task_kwargs.get("jobs_file") or ANALYTICS_FILE
+        if os.path.exists(jobs_file):
+            upload_jobs_file(jobs_file, f"scrape_{task_kwargs.get('job_id')}")
+        return {"statusCode": 200, "body": json.dumps({"job_id": task_kwargs.get("job_id")})}
+
     if is_scheduled_event(event):
         print("📅 Scheduled event detected")
         src = event.get("detail") or event
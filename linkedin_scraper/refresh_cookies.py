@@ -33,9 +33,9 @@ def main():
         
         print("📦 Uploading cookies to S3...")
         s3_client = boto3.client('s3')
-        s3_key = "cookies/li_cookies.pkl"
+        s3_key = "cookies/li_cookies.json"
         
-        s3_client.upload_file('li_cookies.pkl', bucket, s3_key)
+        s3_client.upload_file('li_cookies.json', bucket, s3_key)
         print(f"✅ Cookies uploaded to s3://{bucket}/{s3_key}")
         
         # Upload metadata
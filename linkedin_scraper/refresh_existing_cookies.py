@@ -7,16 +7,14 @@ Two strategies:
   2. Browser refresh (fallback) — opens headless Chrome with cookies loaded.
 """
 
-import pickle
 import time
 import os
-import re
-import subprocess
 import boto3
 import json
 import requests
 from datetime import datetime, timezone
 from dotenv import load_dotenv
+from src.login import detect_chrome_version, save_cookies
 
 load_dotenv()
 
@@ -25,31 +23,44 @@ def load_cookies_from_s3():
     """Download cookies from S3, falling back to local file. Returns list or None."""
     bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
     s3_client = boto3.client('s3')
-    s3_key = "cookies/li_cookies.pkl"
+    s3_key = "cookies/li_cookies.json"
 
     try:
-        s3_client.download_file(bucket_name, s3_key, 'li_cookies.pkl')
+        s3_client.download_file(bucket_name, s3_key, 'li_cookies.json')
         print("✅ Downloaded existing cookies from S3")
     except Exception as e:
         print(f"⚠️ Could not download cookies from S3: {e}")
-        if not os.path.exists('li_cookies.pkl'):
+        try:
+            # One-time migration from the old pickled cookie store; the JSON object is used once it exists
+            import pickle
+            s3_client.download_file(bucket_name, "cookies/li_cookies.pkl", 'li_cookies.pkl')
+            with open('li_cookies.pkl', 'rb') as f:
+                legacy_cookies = pickle.load(f)
+            os.remove('li_cookies.pkl')
+            with open('li_cookies.json', 'w') as f:
+                json.dump({'cookies': legacy_cookies}, f)
+            s3_client.upload_file('li_cookies.json', bucket_name, s3_key)
+            print("✅ Migrated legacy pickled cookies from S3 to JSON")
+        except Exception as legacy_error:
+            print(f"⚠️ No legacy cookies in S3 either: {legacy_error}")
+        if not os.path.exists('li_cookies.json'):
             print("❌ No existing cookies found. Please run full login first.")
             return None
         print("✅ Using local cookies file")
 
-    with open('li_cookies.pkl', 'rb') as f:
-        cookies = pickle.load(f)
+    with open('li_cookies.json') as f:
+        cookies = json.load(f)['cookies']
     print(f"📦 Loaded {len(cookies)} existing cookies")
     return cookies
 
 
 def upload_cookies_to_s3(method="cookie_refresh"):
-    """Upload li_cookies.pkl and metadata to S3."""
+    """Upload li_cookies.json and metadata to S3."""
     bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
     s3_client = boto3.client('s3')
-    s3_key = "cookies/li_cookies.pkl"
+    s3_key = "cookies/li_cookies.json"
 
-    s3_client.upload_file('li_cookies.pkl', bucket_name, s3_key)
+    s3_client.upload_file('li_cookies.json', bucket_name, s3_key)
     print(f"✅ Updated cookies uploaded to s3://{bucket_name}/{s3_key}")
 
     metadata = {
@@ -122,8 +133,7 @@ def refresh_via_http(cookies):
             if c['name'] not in seen:
                 updated.append(c)
 
-        with open('li_cookies.pkl', 'wb') as f:
-            pickle.dump(updated, f)
+        save_cookies(updated)
         print(f"💾 Saved {len(updated)} refreshed cookies")
 
         upload_cookies_to_s3(method="http_refresh")
@@ -138,29 +148,6 @@ def refresh_via_http(cookies):
 # Strategy 2: Browser refresh (fallback)
 # ---------------------------------------------------------------------------
 
-def detect_chrome_version():
-    """Detect the installed Chrome/Chromium major version."""
-    candidates = [
-        "google-chrome --version",
-        "google-chrome-stable --version",
-        "chromium --version",
-        "chromium-browser --version",
-        '"/Applications/Google Chrome.app/Contents/MacOS/Google Chrome" --version',
-    ]
-    for cmd in candidates:
-        try:
-            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL).decode()
-            match = re.search(r"(\d+)\.", output)
-            if match:
-                version = int(match.group(1))
-                print(f"🔍 Detected Chrome/Chromium version: {version}")
-                return version
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
-    print("⚠️ Could not detect Chrome version, letting undetected_chromedriver auto-detect")
-    return None
-
-
 def refresh_via_browser(cookies):
     """Load cookies into a headless browser, visit LinkedIn, and save refreshed cookies."""
     import undetected_chromedriver as uc
@@ -175,6 +162,7 @@ def refresh_via_browser(cookies):
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
 
     if os.path.exists('/.dockerenv') or os.getenv('GITHUB_ACTIONS'):
         for path in ['/usr/bin/google-chrome-stable', '/usr/bin/google-chrome',
@@ -182,7 +170,7 @@ def refresh_via_browser(cookies):
             if os.path.exists(path):
                 options.binary_location = path
                 break
-        options.add_argument('--headless')
+        options.add_argument('--headless=new')
         options.add_argument('--remote-debugging-port=9222')
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) '
@@ -191,6 +179,8 @@ def refresh_via_browser(cookies):
 
     chrome_version = detect_chrome_version()
     driver = uc.Chrome(options=options, version_main=chrome_version)
+    # Reuse one HTTP connection to chromedriver for every WebDriver command
+    driver.command_executor.keep_alive = True
 
     try:
         # Navigate to LinkedIn first (required before adding cookies)
@@ -219,7 +209,7 @@ def refresh_via_browser(cookies):
 
         # Check login state
         try:
-            WebDriverWait(driver, 15).until(
+            WebDriverWait(driver, 15, poll_frequency=0.1).until(
                 EC.any_of(
                     EC.presence_of_element_located((By.CSS_SELECTOR, ".global-nav__me")),
                     EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='Search']")),
@@ -233,8 +223,7 @@ def refresh_via_browser(cookies):
         print("✅ Browser refresh succeeded — still logged in!")
         updated_cookies = driver.get_cookies()
 
-        with open('li_cookies.pkl', 'wb') as f:
-            pickle.dump(updated_cookies, f)
+        save_cookies(updated_cookies)
         print(f"💾 Saved {len(updated_cookies)} refreshed cookies")
 
         upload_cookies_to_s3(method="browser_refresh")
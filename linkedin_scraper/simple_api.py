@@ -6,20 +6,35 @@ Single file implementation - no auth, no complex routing
 
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
-import json
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import asyncio
+import functools
+import itertools
+import mmap
+import orjson
 import os
-import subprocess
+import threading
+import time
 import uuid
+import zstandard
 from datetime import datetime
-from typing import Dict, Optional, List
-from pydantic import BaseModel
-from collections import defaultdict
-
-# Import your existing scraper
+from decimal import Decimal
+from typing import Dict, Optional, List, NamedTuple
+from pydantic import BaseModel, Field
+from array import array
+from collections import Counter, defaultdict
+
+__all__ = [
+    "app",
+    "ANALYTICS_FILE",
+    "read_s3_hourly_batches_or_local_analytics",
+    "run_analytics_task",
+]
+
+# Import your existing scraper (src/ holds the ats/apply packages)
 import sys
-sys.path.append('src')
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from ats.router import ats_router
@@ -27,10 +42,7 @@ from apply.router import apply_router
 
 # Company tier system
 try:
-    from company_tracker.company_ranker import (
-        rank_companies, quick_score, get_company_tier,
-        get_tier_summary, compute_composite_score,
-    )
+    from company_tracker.company_ranker import quick_score, get_company_tier
     from company_tracker.tier_config import TIER_LABELS, TIER_THRESHOLDS
     COMPANY_TIERS_AVAILABLE = True
 except ImportError:
@@ -42,7 +54,8 @@ except ImportError:
 app = FastAPI(
     title="AI Job Insights & Application Tool",
     description="LinkedIn job scraping with ATS resume analysis",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -54,6 +67,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (/latest, /analytics-jobs) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Mount routers
 app.include_router(ats_router)
@@ -67,6 +83,19 @@ EXP_LABEL = {"1": "intern", "2": "entry", "3": "associate", "4": "mid-senior", "
 JT_LABEL = {"I": "internship", "F": "full_time", "C": "contract", "T": "temporary", "P": "part_time", "V": "volunteer", "O": "other"}
 WT_LABEL = {"1": "on_site", "2": "remote", "3": "hybrid"}
 
+# Reverse lookups (label -> code), built once at import
+EXP_CODE_BY_LABEL = {label: code for code, label in EXP_LABEL.items()}
+JT_CODE_BY_LABEL = {label: code for code, label in JT_LABEL.items()}
+WT_CODE_BY_LABEL = {label: code for code, label in WT_LABEL.items()}
+
+# Filter options advertised by /filters
+EXP_OPTIONS = ["intern", "entry", "associate", "mid-senior", "director", "executive"]
+JT_OPTIONS = ["internship", "full_time", "contract", "temporary", "part_time", "volunteer", "other"]
+WT_OPTIONS = ["remote", "on_site", "hybrid"]
+
+# Job fields /filter can match on, in request-field order
+FILTER_FIELDS = ("experience_level", "job_type_label", "workplace_type_label")
+
 # Request models
 class ScrapeRequest(BaseModel):
     keywords: Optional[str] = None
@@ -82,123 +111,496 @@ class FilterRequest(BaseModel):
     experience_level: Optional[str] = None  # intern, entry, associate, mid-senior, director, executive
     job_type: Optional[str] = None  # internship, full_time, contract, temporary, part_time, volunteer, other
     workplace_type: Optional[str] = None  # remote, on_site, hybrid
-    limit: Optional[int] = 50
+    limit: Optional[int] = Field(50, ge=0)  # negative values are rejected with 422
+
 
+class JobStore:
+    """Scrape-job status shared by every worker and Lambda invocation.
+
+    Items live in the DynamoDB scrape-jobs table and expire after
+    JOB_TTL_SECONDS (the table's TTL attribute is `expires_at`). Without
+    DynamoDB (local dev) the store degrades to an in-process dict.
+    """
+
+    JOB_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+        self._local: Dict[str, Dict] = {}
+        self._table = None
+        self._dynamo_available = True
+
+    def _dynamo(self):
+        """The DynamoDB table, or None if boto3 or the table resource can't be built."""
+        if self._table is None and self._dynamo_available:
+            try:
+                import boto3
+                dynamo = boto3.resource("dynamodb", region_name=os.getenv("AWS_REGION", "us-east-1"))
+                self._table = dynamo.Table(self.table_name)
+            except Exception as e:
+                print(f"⚠️ Job store using local memory: {e}")
+                self._dynamo_available = False
+        return self._table
+
+    def _dynamo_failed(self, action: str, error: Exception):
+        # Only this call falls back; the next one tries DynamoDB again
+        print(f"⚠️ Job store {action} failed, using local memory: {error}")
+
+    @staticmethod
+    def _from_dynamo(value):
+        """Turn DynamoDB Decimals back into ints/floats so responses serialize."""
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, dict):
+            return {k: JobStore._from_dynamo(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [JobStore._from_dynamo(v) for v in value]
+        return value
+
+    def set(self, job_id: str, job: Dict):
+        self._local[job_id] = job
+        table = self._dynamo()
+        if table is not None:
+            try:
+                item = {**job, "job_id": job_id, "expires_at": int(time.time()) + self.JOB_TTL_SECONDS}
+                table.put_item(Item=item)
+            except Exception as e:
+                self._dynamo_failed("write", e)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        table = self._dynamo()
+        if table is not None:
+            try:
+                item = table.get_item(Key={"job_id": job_id}).get("Item")
+                if item is not None:
+                    return self._from_dynamo(item)
+            except Exception as e:
+                self._dynamo_failed("read", e)
+        return self._local.get(job_id)
+
+    def update(self, job_id: str, **fields):
+        """Write only `fields` (and a fresh TTL) so concurrent writers' other fields survive."""
+        self._local[job_id] = {**self._local.get(job_id, {}), **fields}
+        table = self._dynamo()
+        if table is not None:
+            try:
+                fields = {**fields, "expires_at": int(time.time()) + self.JOB_TTL_SECONDS}
+                names = {f"#f{i}": name for i, name in enumerate(fields)}
+                values = {f":v{i}": value for i, value in enumerate(fields.values())}
+                table.update_item(
+                    Key={"job_id": job_id},
+                    UpdateExpression="SET " + ", ".join(f"#f{i} = :v{i}" for i in range(len(fields))),
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues=values,
+                )
+            except Exception as e:
+                self._dynamo_failed("update", e)
+
+    def list(self) -> Dict[str, Dict]:
+        jobs = dict(self._local)
+        table = self._dynamo()
+        if table is not None:
+            try:
+                response = table.scan()
+                items = response.get("Items", [])
+                while "LastEvaluatedKey" in response:
+                    response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
+                    items.extend(response.get("Items", []))
+                jobs.update({item["job_id"]: self._from_dynamo(item) for item in items})
+            except Exception as e:
+                self._dynamo_failed("scan", e)
+        return jobs
+
+
+# Store scrape jobs (status survives restarts and is visible to every worker)
+job_store = JobStore(os.getenv("SCRAPE_JOBS_TABLE", "job-scraper-scrape-jobs"))
+
+# Local accumulating jobs file (NDJSON: one job per line, appended each run)
+ANALYTICS_FILE = '/tmp/analytics_historical_jobs.ndjson'
+
+# When a read finds no data, skip S3 entirely until this monotonic deadline
+EMPTY_RESULT_TTL_SECONDS = 30
+_last_seen_prefix_empty_until: float = 0.0
+
+
+class JobsSnapshot(NamedTuple):
+    """One load of the jobs data and everything derived from it.
+
+    Snapshots are never mutated; a reload builds a new one and swaps it in, so a
+    request that indexes only its own snapshot always sees matching positions.
+    """
+    version: Optional[tuple]  # S3 listing (key + ETag) or local file (mtime, size) it was read from
+    data: list
+    filter_counts: dict
+    filter_index: dict
+    filters_body: bytes
+    jobs_by_hour: Dict[int, List[Dict]]
 
-# Store active jobs
-active_jobs: Dict[str, Dict] = {}
+
+_EMPTY_SNAPSHOT = JobsSnapshot(None, [], {}, {}, b"{}", {})
+_jobs_snapshot = _EMPTY_SNAPSHOT
+_jobs_cache_lock = threading.Lock()  # Serializes reloads only; cache hits never take it
 
 # ----------------------------------------------------------------------------
 # S3-backed aggregation helpers
 # ----------------------------------------------------------------------------
-def read_s3_hourly_batches_or_local_analytics() -> list:
-    """Read today's hourly batch files from S3; fall back to local analytics file.
+@functools.lru_cache(maxsize=None)
+def _s3():
+    """Shared S3 client, created on first use so boto3 stays off the import path."""
+    import boto3
+    from botocore.config import Config
+    return boto3.client('s3', config=Config(max_pool_connections=64))
+
+
+def parse_jobs(buf) -> list:
+    """Parse jobs from NDJSON (one job per line) or a legacy JSON array.
+
+    `buf` may be bytes or an mmap; lines are decoded from zero-copy slices.
+    Malformed lines, e.g. a partial last line from an interrupted append,
+    are skipped rather than failing the whole read.
+    """
+    with memoryview(buf) as view:
+        if bytes(view[:64]).lstrip()[:1] == b'[':
+            jobs = orjson.loads(view)
+            return jobs if isinstance(jobs, list) else [jobs]
+        jobs = []
+        start, size = 0, len(view)
+        while start < size:
+            end = buf.find(b'\n', start)
+            if end == -1:
+                end = size
+            if end > start:
+                try:
+                    jobs.append(orjson.loads(view[start:end]))
+                except orjson.JSONDecodeError:
+                    pass
+            start = end + 1
+        return jobs
+
+
+def dump_jobs_ndjson(jobs: list) -> bytes:
+    """Encode jobs as NDJSON, one compact object per line."""
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE
+    return b''.join(orjson.dumps(job, default=str, option=option) for job in jobs)
+
+
+def decode_hourly_batch(key: str, body: bytes) -> list:
+    """Decode one hourly batch object; `.zst` keys hold zstd-compressed data."""
+    if key.endswith('.zst'):
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return parse_jobs(body)
 
-    Returns a list of job dicts with duplicates removed by job_id.
+
+def load_jobs_file(path: str) -> list:
+    """Parse a jobs file (NDJSON or JSON array) straight from a read-only memory map.
+
+    orjson reads the mapped pages directly, so the file is never copied into
+    an intermediate bytes object before decoding.
     """
-    all_jobs = []
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_jobs(mm)
+
+
+# job_ids already stored in each jobs file, with the (mtime_ns, size) they match;
+# warm runs skip re-reading the whole history unless the file changed underneath
+_stored_job_ids: Dict[str, tuple] = {}
+
+
+def _file_stamp(path: str) -> Optional[tuple]:
     try:
-        import boto3
-        from datetime import datetime, timezone
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def stored_job_ids(path: str) -> set:
+    """IDs already in the jobs file at `path`; reads the file only when it changed since the last read/append."""
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return set()
+    cached = _stored_job_ids.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    job_ids = {job.get('job_id') for job in load_jobs_file(path)}
+    _stored_job_ids[path] = (stamp, job_ids)
+    return job_ids
+
+
+def append_new_jobs(path: str, new_jobs: list, job_ids: set) -> int:
+    """Append `new_jobs` to the NDJSON file at `path` and record their IDs; returns the stored total.
+
+    `job_ids` must be the set stored_job_ids() returned for `path`; readers skip a
+    partial trailing line.
+    """
+    with open(path, 'ab+') as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+        f.write(dump_jobs_ndjson(new_jobs))
+    job_ids.update(job['job_id'] for job in new_jobs)
+    _stored_job_ids[path] = (_file_stamp(path), job_ids)
+    return len(job_ids)
 
-        s3_client = boto3.client('s3')
-        bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
-        today = datetime.now(timezone.utc).date()
-        prefix = f"jobs/hourly/{today}/"
-
-        response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                if obj['Key'].endswith('.json'):
-                    file_obj = s3_client.get_object(Bucket=bucket_name, Key=obj['Key'])
-                    batch_jobs = json.loads(file_obj['Body'].read().decode('utf-8'))
-                    if isinstance(batch_jobs, list):
-                        all_jobs.extend(batch_jobs)
-                    else:
-                        all_jobs.append(batch_jobs)
+
+def posted_epoch(job: dict) -> Optional[int]:
+    """Return a job's posting time as epoch seconds, parsing posted_dt only once.
+
+    The result is cached on the job as `_posted_epoch` so later reads skip parsing.
+    """
+    if '_posted_epoch' in job:
+        return job['_posted_epoch']
+    epoch = None
+    for date_field in ('posted_dt', 'listedAt', 'created_at_formatted'):
+        value = job.get(date_field)
+        if value:
+            try:
+                epoch = int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+                break
+            except (ValueError, TypeError, AttributeError):
+                continue
+    job['_posted_epoch'] = epoch
+    return epoch
+
+
+def index_jobs_by_hour(jobs: list) -> Dict[int, List[Dict]]:
+    """Bucket jobs by posting hour so time-window queries only touch recent buckets."""
+    index = defaultdict(list)
+    for job in jobs:
+        epoch = posted_epoch(job)
+        if epoch is not None:
+            index[epoch // 3600].append(job)
+    return dict(index)
+
+
+def _dedupe_jobs(all_jobs: list) -> list:
+    """Drop repeated postings, keeping the first occurrence of each job_id."""
+    seen_ids = set()
+    unique_jobs = []
+    for job in all_jobs:
+        job_id = job.get('job_id') or job.get('id')
+        if job_id and job_id not in seen_ids:
+            seen_ids.add(job_id)
+            unique_jobs.append(job)
+    return unique_jobs
+
+
+def compute_filter_counts(jobs: list) -> Dict[str, Dict[str, int]]:
+    """Count jobs per experience level, job type and workplace type label."""
+    return {
+        "experience_levels": dict(Counter(job.get('experience_level', 'unknown') for job in jobs)),
+        "job_types": dict(Counter(job.get('job_type_label', 'unknown') for job in jobs)),
+        "workplace_types": dict(Counter(job.get('workplace_type_label', 'unknown') for job in jobs)),
+    }
+
+
+def encode_filters(counts: Dict[str, Dict[str, int]]) -> bytes:
+    """Pre-encode the /filters "filters" object (static options + current counts)."""
+    return orjson.dumps({
+        "experience_levels": {"options": EXP_OPTIONS, "counts": counts.get("experience_levels", {})},
+        "job_types": {"options": JT_OPTIONS, "counts": counts.get("job_types", {})},
+        "workplace_types": {"options": WT_OPTIONS, "counts": counts.get("workplace_types", {})},
+    })
+
+
+def build_filter_index(jobs: list) -> Dict[str, Dict[str, array]]:
+    """Map each filter field's label to the positions of matching jobs (in list order).
+
+    Positions are stored as packed uint32 arrays (4 bytes each) rather than
+    lists of int objects, so the index stays small and cache-friendly.
+    """
+    index = {field: defaultdict(lambda: array('I')) for field in FILTER_FIELDS}
+    for position, job in enumerate(jobs):
+        for field in FILTER_FIELDS:
+            index[field][job.get(field)].append(position)
+    return {field: dict(postings) for field, postings in index.items()}
+
+
+def invalidate_jobs_cache():
+    """Force the next read to reload jobs (call after writing new data)."""
+    global _jobs_snapshot, _last_seen_prefix_empty_until
+    with _jobs_cache_lock:
+        _jobs_snapshot = _jobs_snapshot._replace(version=None)
+    _last_seen_prefix_empty_until = 0.0
+
+
+def _s3_jobs_source():
+    """LIST today's hourly batch files; returns their version and a loader that downloads them."""
+    from datetime import timezone
+
+    s3_client = _s3()
+    bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
+    today = datetime.now(timezone.utc).date()
+    prefix = f"jobs/hourly/{today}/"
+
+    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
+    batch_objects = [obj for obj in response.get('Contents', [])
+                     if obj['Key'].endswith(('.json', '.json.zst', '.ndjson', '.ndjson.zst'))]
+    version = ('s3', tuple((obj['Key'], obj.get('ETag')) for obj in batch_objects))
+
+    def load():
+        all_jobs = []
+        for obj in batch_objects:
+            file_obj = s3_client.get_object(Bucket=bucket_name, Key=obj['Key'])
+            all_jobs.extend(decode_hourly_batch(obj['Key'], file_obj['Body'].read()))
+        return all_jobs
+
+    return version, load
+
+
+def _local_jobs_source():
+    """Version and loader for the local analytics file, or (None, None) if there is none."""
+    try:
+        st = os.stat(ANALYTICS_FILE)
+    except OSError:
+        return None, None
+    return ('local', st.st_mtime_ns, st.st_size), lambda: load_jobs_file(ANALYTICS_FILE)
+
+
+def _read_jobs(version, load):
+    """Run a source's loader, returning (version, jobs).
+
+    A failed S3 download falls back to the local file as a whole, so a partial
+    S3 read is never published; (None, []) when nothing could be read.
+    """
+    try:
+        return version, load()
+    except Exception as read_error:
+        print(f"⚠️ {'S3' if version[0] == 's3' else 'Local analytics'} read failed: {read_error}")
+    if version[0] == 's3':
+        local_version, local_load = _local_jobs_source()
+        if local_load is not None:
+            return _read_jobs(local_version, local_load)
+    return None, []
+
+
+def load_jobs_snapshot() -> JobsSnapshot:
+    """Return the current JobsSnapshot of today's S3 hourly batches (or the local analytics file).
+
+    Jobs are deduped by job_id. The S3 LIST (or local stat) runs without the lock,
+    so requests for an unchanged version return the cached snapshot immediately;
+    only a version change takes the lock to download, rebuild and swap (re-checking
+    first in case another thread already loaded it). An empty result is remembered
+    for EMPTY_RESULT_TTL_SECONDS so repeated requests during cold/empty periods
+    don't each pay for an S3 round-trip.
+    """
+    global _jobs_snapshot, _last_seen_prefix_empty_until
+    if time.monotonic() < _last_seen_prefix_empty_until:
+        return _EMPTY_SNAPSHOT
+
+    try:
+        version, load = _s3_jobs_source()
     except Exception as s3_error:
         print(f"⚠️ S3 read failed: {s3_error}")
-        # Fallback to local analytics file
-        analytics_file = '/tmp/analytics_historical_jobs.json'
-        if os.path.exists(analytics_file):
-            try:
-                with open(analytics_file, 'r') as f:
-                    all_jobs = json.load(f)
-            except Exception as local_err:
-                print(f"⚠️ Local analytics read failed: {local_err}")
-
-    # Dedupe by job_id
-    if all_jobs:
-        seen_ids = set()
-        unique_jobs = []
-        for job in all_jobs:
-            job_id = job.get('job_id') or job.get('id')
-            if job_id and job_id not in seen_ids:
-                seen_ids.add(job_id)
-                unique_jobs.append(job)
-        all_jobs = unique_jobs
-
-    return all_jobs
+        version, load = _local_jobs_source()
+
+    snapshot = _jobs_snapshot
+    if version is not None and version == snapshot.version:
+        return snapshot
+
+    with _jobs_cache_lock:
+        snapshot = _jobs_snapshot
+        if version is not None and version == snapshot.version:
+            return snapshot
+
+        version, all_jobs = _read_jobs(version, load) if load is not None else (None, [])
+
+        # Dedupe by job_id
+        if all_jobs:
+            all_jobs = _dedupe_jobs(all_jobs)
+        else:
+            _last_seen_prefix_empty_until = time.monotonic() + EMPTY_RESULT_TTL_SECONDS
+
+        filter_counts = compute_filter_counts(all_jobs)
+        snapshot = JobsSnapshot(
+            version=version,
+            data=all_jobs,
+            filter_counts=filter_counts,
+            filter_index=build_filter_index(all_jobs),
+            filters_body=encode_filters(filter_counts),
+            jobs_by_hour=index_jobs_by_hour(all_jobs),
+        )
+        _jobs_snapshot = snapshot
+
+    return snapshot
+
+
+def read_s3_hourly_batches_or_local_analytics() -> list:
+    """Read today's hourly batch files from S3; fall back to local analytics file.
+
+    Returns the (cached) list of job dicts with duplicates removed by job_id; see
+    load_jobs_snapshot() for callers that also need the derived indexes.
+    """
+    return load_jobs_snapshot().data
+
+# Static service description, encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "AI Job Insights & Application Tool",
+    "version": "2.0.0",
+    "endpoints": {
+        "scrape": "GET /scrape (manual trigger) or POST /scrape (programmatic)",
+        "status": "GET /scrape/{job_id}",
+        "analytics_jobs": "GET /analytics-jobs (all accumulated data)",
+        "latest": "GET /latest (all jobs from last 24 hours, sorted by date)",
+        "filter": "POST /filter (filter analytics data)",
+        "filters": "GET /filters (available filter options)",
+        "batch_info": "GET /batch-info",
+        "health": "GET /health",
+        "test": "GET /test-scraper",
+        "ats_upload": "POST /ats/upload (upload resume PDF/DOCX)",
+        "ats_resumes": "GET /ats/resumes (list uploaded resumes)",
+        "ats_resume": "GET /ats/resumes/{resume_id} (get parsed resume)",
+        "ats_match": "POST /ats/match (score resume against jobs)",
+        "ats_analyze": "POST /ats/analyze (AI-powered deep analysis)",
+        "ats_gaps": "GET /ats/gaps/{resume_id}/{job_id} (keyword gap analysis)",
+        "company_tiers": "GET /companies/tiers (tier distribution of scraped jobs)",
+        "company_rank": "GET /companies/rank?name=CompanyName (get tier for a company)",
+        "company_top": "GET /companies/top?tier=T1_ELITE&limit=20 (top companies by tier)",
+        "apply_register": "POST /apply/auth/register (get API key)",
+        "apply_profile": "POST /apply/profile (create/update profile)",
+        "apply_resume": "POST /apply/profile/resume (upload resume)",
+        "apply_scored_jobs": "GET /apply/jobs/scored (jobs ranked by fit)",
+        "apply_cover_letter": "POST /apply/generate/cover-letter",
+        "apply_resume_tailor": "POST /apply/generate/resume-tailor",
+        "apply_answer": "POST /apply/generate/answer",
+        "apply_fit_summary": "POST /apply/generate/fit-summary",
+        "apply_applications": "GET /apply/applications (tracked applications)",
+        "apply_stats": "GET /apply/applications/stats",
+    },
+    "data_source": {
+        "analytics": "analytics_historical_jobs.ndjson (accumulating hourly)"
+    },
+    "features": {
+        "hourly_scraping": "Automatically runs analytics every hour",
+        "data_accumulation": "Builds historical dataset over time",
+        "batch_processing": "Supports Lambda-compatible batch processing",
+        "filtering": "Filter by experience, job type, workplace type"
+    }
+})
 
 @app.get("/")
 @app.head("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "AI Job Insights & Application Tool",
-        "version": "2.0.0",
-        "endpoints": {
-            "scrape": "GET /scrape (manual trigger) or POST /scrape (programmatic)",
-            "status": "GET /scrape/{job_id}",
-            "analytics_jobs": "GET /analytics-jobs (all accumulated data)",
-            "latest": "GET /latest (all jobs from last 24 hours, sorted by date)",
-            "filter": "POST /filter (filter analytics data)",
-            "filters": "GET /filters (available filter options)",
-            "batch_info": "GET /batch-info",
-            "health": "GET /health",
-            "test": "GET /test-scraper",
-            "ats_upload": "POST /ats/upload (upload resume PDF/DOCX)",
-            "ats_resumes": "GET /ats/resumes (list uploaded resumes)",
-            "ats_resume": "GET /ats/resumes/{resume_id} (get parsed resume)",
-            "ats_match": "POST /ats/match (score resume against jobs)",
-            "ats_analyze": "POST /ats/analyze (AI-powered deep analysis)",
-            "ats_gaps": "GET /ats/gaps/{resume_id}/{job_id} (keyword gap analysis)",
-            "company_tiers": "GET /companies/tiers (tier distribution of scraped jobs)",
-            "company_rank": "GET /companies/rank?name=CompanyName (get tier for a company)",
-            "company_top": "GET /companies/top?tier=T1_ELITE&limit=20 (top companies by tier)",
-            "apply_register": "POST /apply/auth/register (get API key)",
-            "apply_profile": "POST /apply/profile (create/update profile)",
-            "apply_resume": "POST /apply/profile/resume (upload resume)",
-            "apply_scored_jobs": "GET /apply/jobs/scored (jobs ranked by fit)",
-            "apply_cover_letter": "POST /apply/generate/cover-letter",
-            "apply_resume_tailor": "POST /apply/generate/resume-tailor",
-            "apply_answer": "POST /apply/generate/answer",
-            "apply_fit_summary": "POST /apply/generate/fit-summary",
-            "apply_applications": "GET /apply/applications (tracked applications)",
-            "apply_stats": "GET /apply/applications/stats",
-        },
-        "data_source": {
-            "analytics": "analytics_historical_jobs.json (accumulating hourly)"
-        },
-        "features": {
-            "hourly_scraping": "Automatically runs analytics every hour",
-            "data_accumulation": "Builds historical dataset over time",
-            "batch_processing": "Supports Lambda-compatible batch processing",
-            "filtering": "Filter by experience, job type, workplace type"
-        }
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
-@app.get("/health")
-async def health_check():
-    """Health check with cookie status"""
-    cookie_status = "unknown"
-    cookie_age_hours = None
+# Cookie freshness changes at most daily, so /health re-checks S3 this often
+COOKIE_CHECK_TTL_SECONDS = 300
+_cookie_check: Dict[str, object] = {"checked_at": float("-inf"), "refreshed_at": None, "status": "unknown"}
 
-    try:
-        import boto3
-        from datetime import timezone
 
-        s3_client = boto3.client('s3')
+def _cookie_refreshed_at():
+    """Return (refreshed_at, status) from the S3 cookie metadata, cached briefly."""
+    if time.monotonic() - _cookie_check["checked_at"] < COOKIE_CHECK_TTL_SECONDS:
+        return _cookie_check["refreshed_at"], _cookie_check["status"]
+
+    refreshed_at, status = None, "ok"
+    try:
+        s3_client = _s3()
         bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
 
         try:
@@ -206,28 +608,41 @@ async def health_check():
                 Bucket=bucket_name,
                 Key="cookies/li_cookies_metadata.json"
             )
-            metadata = json.loads(metadata_obj['Body'].read().decode('utf-8'))
+            metadata = orjson.loads(metadata_obj['Body'].read())
             refreshed_at = datetime.fromisoformat(metadata.get('refreshed_at', ''))
-            age = datetime.now(timezone.utc) - refreshed_at
-            cookie_age_hours = round(age.total_seconds() / 3600, 1)
-
-            if cookie_age_hours > 168:  # > 7 days
-                cookie_status = "expired"
-            elif cookie_age_hours > 120:  # > 5 days
-                cookie_status = "stale"
-            else:
-                cookie_status = "fresh"
         except Exception:
-            cookie_status = "missing"
+            status = "missing"
     except Exception:
-        cookie_status = "check_failed"
+        status = "check_failed"
 
-    return {
+    _cookie_check.update(checked_at=time.monotonic(), refreshed_at=refreshed_at, status=status)
+    return refreshed_at, status
+
+
+@app.get("/health")
+def health_check():
+    """Health check with cookie status"""
+    from datetime import timezone
+
+    cookie_age_hours = None
+    refreshed_at, cookie_status = _cookie_refreshed_at()
+    if refreshed_at is not None:
+        age = datetime.now(timezone.utc) - refreshed_at
+        cookie_age_hours = round(age.total_seconds() / 3600, 1)
+
+        if cookie_age_hours > 168:  # > 7 days
+            cookie_status = "expired"
+        elif cookie_age_hours > 120:  # > 5 days
+            cookie_status = "stale"
+        else:
+            cookie_status = "fresh"
+
+    return Response(orjson.dumps({
         "status": "healthy",
         "cookie_status": cookie_status,
         "cookie_age_hours": cookie_age_hours,
         "timestamp": datetime.now().isoformat()
-    }
+    }), media_type="application/json")
 
 @app.get("/test-scraper")
 async def test_scraper():
@@ -259,7 +674,7 @@ async def test_scraper():
 
 
 @app.get("/scrape")
-async def start_scrape_manual(
+def start_scrape_manual(
     keywords: Optional[str] = None,
     max_shards: Optional[int] = 126,
     mode: Optional[str] = "daily",
@@ -284,10 +699,10 @@ async def start_scrape_manual(
     )
     
     # Use the existing POST logic
-    return await start_scrape(request, background_tasks)
+    return start_scrape(request, background_tasks)
 
 @app.post("/scrape")
-async def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks):
+def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks):
     """Start a scraping job - runs analytics and accumulates data hourly"""
     job_id = str(uuid.uuid4())
     
@@ -298,10 +713,33 @@ async def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks
     keywords = request.keywords or DEFAULT_KEYWORDS
     
     # Use analytics data file for accumulating data
-    jobs_file = '/tmp/analytics_historical_jobs.json'
+    jobs_file = ANALYTICS_FILE
+    
+    # Convert human-readable filters to parameter lists (validated before the
+    # job is recorded, so a bad filter never leaves a phantom "starting" job)
+    exp_codes = None
+    if request.experience_level:
+        code = EXP_CODE_BY_LABEL.get(request.experience_level)
+        if code is None:
+            raise HTTPException(status_code=400, detail=f"Invalid experience level: {request.experience_level}")
+        exp_codes = [code]
+    
+    jt_codes = None
+    if request.job_type:
+        code = JT_CODE_BY_LABEL.get(request.job_type)
+        if code is None:
+            raise HTTPException(status_code=400, detail=f"Invalid job type: {request.job_type}")
+        jt_codes = [code]
+    
+    wt_codes = None
+    if request.workplace_type:
+        code = WT_CODE_BY_LABEL.get(request.workplace_type)
+        if code is None:
+            raise HTTPException(status_code=400, detail=f"Invalid workplace type: {request.workplace_type}")
+        wt_codes = [code]
     
     # Store job info with filters and batch info
-    active_jobs[job_id] = {
+    job_store.set(job_id, {
         "status": "starting",
         "mode": "analytics",  # Always run as analytics to accumulate data
         "keywords": keywords,
@@ -315,41 +753,25 @@ async def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks
         "retention": "accumulating",
         "started_at": datetime.now().isoformat(),
         "message": f"Starting analytics scrape (batch {request.batch_number}) - accumulating data..."
-    }
-    
-    # Convert human-readable filters to parameter lists
-    exp_codes = None
-    if request.experience_level:
-        exp_codes = [code for code, label in EXP_LABEL.items() if label == request.experience_level]
-        if not exp_codes:
-            raise HTTPException(status_code=400, detail=f"Invalid experience level: {request.experience_level}")
+    })
     
-    jt_codes = None
-    if request.job_type:
-        jt_codes = [code for code, label in JT_LABEL.items() if label == request.job_type]
-        if not jt_codes:
-            raise HTTPException(status_code=400, detail=f"Invalid job type: {request.job_type}")
-    
-    wt_codes = None
-    if request.workplace_type:
-        wt_codes = [code for code, label in WT_LABEL.items() if label == request.workplace_type]
-        if not wt_codes:
-            raise HTTPException(status_code=400, detail=f"Invalid workplace type: {request.workplace_type}")
+    task_kwargs = {
+        "job_id": job_id,
+        "keywords": keywords,
+        "max_shards": request.max_shards,
+        "time_filter": time_filter,
+        "exp_codes": exp_codes,
+        "jt_codes": jt_codes,
+        "wt_codes": wt_codes,
+        "batch_size": request.batch_size,
+        "batch_number": request.batch_number,
+        "jobs_file": jobs_file,
+    }
     
-    # Run analytics scraper in background with filters and batch info
-    background_tasks.add_task(
-        run_analytics_task, 
-        job_id, 
-        keywords,
-        request.max_shards, 
-        time_filter,
-        exp_codes, 
-        jt_codes, 
-        wt_codes,
-        request.batch_size,
-        request.batch_number,
-        jobs_file
-    )
+    # On Lambda, hand the scrape to a separate async invocation so it doesn't
+    # run (and get frozen) inside this request; locally use a background task
+    if not enqueue_scrape(task_kwargs):
+        background_tasks.add_task(run_analytics_task, **task_kwargs)
     
     return {
         "job_id": job_id,
@@ -361,12 +783,12 @@ async def start_scrape(request: ScrapeRequest, background_tasks: BackgroundTasks
     }
 
 @app.get("/scrape/{job_id}")
-async def get_scrape_status(job_id: str):
+def get_scrape_status(job_id: str):
     """Get status of a scraping job"""
-    if job_id not in active_jobs:
+    job = job_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = active_jobs[job_id]
     return {
         "job_id": job_id,
         "status": job["status"],
@@ -376,20 +798,47 @@ async def get_scrape_status(job_id: str):
         "results": job.get("results")
     }
 
+def enqueue_scrape(task_kwargs: dict) -> bool:
+    """Queue a scrape as an async self-invocation of this Lambda function.
+
+    lambda_handler routes `{"scrape_job": task_kwargs}` events to
+    run_analytics_task. Returns False outside Lambda so the caller can run
+    the task in-process instead.
+    """
+    function_name = os.getenv("AWS_LAMBDA_FUNCTION_NAME")
+    if not function_name:
+        return False
+    try:
+        import boto3
+        boto3.client("lambda").invoke(
+            FunctionName=function_name,
+            InvocationType="Event",
+            Payload=orjson.dumps({"scrape_job": task_kwargs}),
+        )
+        print(f"📨 Queued scrape {task_kwargs['job_id']} via async invoke")
+        return True
+    except Exception as e:
+        print(f"⚠️ Async invoke failed, running in-process: {e}")
+        return False
+
 async def run_analytics_task(job_id: str, keywords: str, max_shards: int, time_filter: str,
                            exp_codes: list = None, jt_codes: list = None, wt_codes: list = None,
                            batch_size: int = 18, batch_number: int = 1, jobs_file: str = None):
     """Background task for analytics scraping"""
     try:
         # Ensure job entry exists (scheduled invocations may not pre-register)
-        if job_id not in active_jobs:
-            active_jobs[job_id] = {
+        if await asyncio.to_thread(job_store.get, job_id) is None:
+            await asyncio.to_thread(job_store.set, job_id, {
                 "status": "queued",
+                "mode": "analytics",
                 "message": "Scheduled analytics run",
                 "started_at": datetime.now().isoformat(),
-            }
-        active_jobs[job_id]["status"] = "running"
-        active_jobs[job_id]["message"] = "Running analytics scrape..."
+            })
+        await asyncio.to_thread(
+            job_store.update, job_id,
+            status="running",
+            message="Running analytics scrape...",
+        )
         print(f"🚀 Starting analytics task {job_id}")
         print(f"📊 Data file: {jobs_file}")
         print(f"📊 Retention: accumulating")
@@ -402,9 +851,11 @@ async def run_analytics_task(job_id: str, keywords: str, max_shards: int, time_f
             print(f"❌ Import failed: {import_error}")
             raise
         
-        # Run the scraper with filters and batch processing
+        # Run the scraper with filters and batch processing. The scraper drives its
+        # own asyncio loop (asyncio.run), so it needs a thread of its own.
         print("🔄 Starting analytics scraper...")
-        all_jobs, shard_results, shard_mappings = scrape_all_shards_api_only(
+        all_jobs, shard_results, shard_mappings = await asyncio.to_thread(
+            scrape_all_shards_api_only,
             keywords=keywords,
             max_shards=max_shards,
             resume=False,
@@ -422,69 +873,93 @@ async def run_analytics_task(job_id: str, keywords: str, max_shards: int, time_f
         if not all_jobs and not shard_results:
             error_msg = "No results — cookies likely expired. Refresh via GitHub Actions or locally."
             print(f"❌ {error_msg}")
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["message"] = error_msg
-            active_jobs[job_id]["completed_at"] = datetime.now().isoformat()
+            await asyncio.to_thread(
+                job_store.update, job_id,
+                status="failed",
+                message=error_msg,
+                completed_at=datetime.now().isoformat(),
+            )
             return  # Don't overwrite existing good data
 
-        # Load existing analytics data
-        existing_jobs = []
-        if os.path.exists(jobs_file):
-            with open(jobs_file, 'r') as f:
-                existing_jobs = json.load(f)
-        
-        # Merge new jobs with existing (avoid duplicates)
-        existing_job_ids = {job.get('job_id') for job in existing_jobs}
-        new_jobs = [job for job in all_jobs if job.get('job_id') not in existing_job_ids]
+        # IDs already stored (the full file is only read on a cold start or after an
+        # outside change; file I/O runs in a thread to keep the event loop free)
+        existing_job_ids = await asyncio.to_thread(stored_job_ids, jobs_file)
+        new_jobs = [job.to_dict() for job in all_jobs if job.job_id not in existing_job_ids]
+
+        # Parse posting dates once at ingestion so readers never re-parse them
+        for job in new_jobs:
+            posted_epoch(job)
         
-        # Combine and save
-        combined_jobs = existing_jobs + new_jobs
-        with open(jobs_file, 'w') as f:
-            json.dump(combined_jobs, f, indent=2, default=str)
+        # Append only the new jobs
+        total_jobs = await asyncio.to_thread(append_new_jobs, jobs_file, new_jobs, existing_job_ids)
+
+        # Fresh data was written: drop the cached copy and the empty-result guard
+        invalidate_jobs_cache()
         
-        print(f"📊 Analytics data updated: {len(new_jobs)} new jobs, {len(combined_jobs)} total")
+        print(f"📊 Analytics data updated: {len(new_jobs)} new jobs, {total_jobs} total")
         
         # Update job status
-        active_jobs[job_id]["status"] = "completed"
-        active_jobs[job_id]["message"] = f"Analytics scrape completed: {len(new_jobs)} new jobs added"
-        active_jobs[job_id]["completed_at"] = datetime.now().isoformat()
-        active_jobs[job_id]["results"] = {
-            "new_jobs": len(new_jobs),
-            "total_jobs": len(combined_jobs),
-            "shards_processed": len(shard_results),
-            "batch_number": batch_number,
-            "batch_size": batch_size,
-            "data_file": jobs_file
-        }
+        await asyncio.to_thread(
+            job_store.update, job_id,
+            status="completed",
+            message=f"Analytics scrape completed: {len(new_jobs)} new jobs added",
+            completed_at=datetime.now().isoformat(),
+            results={
+                "new_jobs": len(new_jobs),
+                "total_jobs": total_jobs,
+                "shards_processed": len(shard_results),
+                "batch_number": batch_number,
+                "batch_size": batch_size,
+                "data_file": jobs_file
+            },
+        )
         
     except Exception as e:
         print(f"❌ Analytics scraping failed: {str(e)}")
         import traceback
         print(f"❌ Full error: {traceback.format_exc()}")
-        active_jobs[job_id]["status"] = "failed"
-        active_jobs[job_id]["message"] = f"Analytics scraping failed: {str(e)}"
-        active_jobs[job_id]["completed_at"] = datetime.now().isoformat()
+        await asyncio.to_thread(
+            job_store.update, job_id,
+            status="failed",
+            message=f"Analytics scraping failed: {str(e)}",
+            completed_at=datetime.now().isoformat(),
+        )
 
 @app.get("/analytics-jobs")
-async def list_analytics_jobs():
+def list_analytics_jobs():
     """List all analytics LinkedIn jobs (accumulating)"""
+    chunk_size = 256
+
+    def encode(start: int) -> bytes:
+        return b','.join(
+            orjson.dumps(job, default=str, option=orjson.OPT_NON_STR_KEYS)
+            for job in all_jobs[start:start + chunk_size]
+        )
+
+    # Read and encode the first chunk up front: once the StreamingResponse is returned,
+    # an error can only cut the body short, not become this JSON error response
     try:
         all_jobs = read_s3_hourly_batches_or_local_analytics()
-        
-        return {
-            "total_jobs": len(all_jobs),
-            "jobs": all_jobs,
-            "retention": "accumulating",
-            "data_source": "s3_or_local"
-        }
+        head = b'{"total_jobs":%d,"retention":"accumulating","data_source":"s3_or_local","jobs":[' % len(all_jobs)
+        head += encode(0)
     except Exception as e:
         return {"error": f"Error reading analytics jobs: {str(e)}", "total_jobs": 0, "jobs": []}
 
+    # Encode a few hundred jobs per chunk so the full payload is never held in memory
+    def stream_jobs():
+        yield head
+        for start in range(chunk_size, len(all_jobs), chunk_size):
+            yield b',' + encode(start)
+        yield b']}'
+
+    return StreamingResponse(stream_jobs(), media_type="application/json")
+
 @app.get("/scrape-jobs")
-async def list_scrape_jobs():
+def list_scrape_jobs():
     """List all background scraping jobs (for tracking)"""
+    scrape_jobs = job_store.list()
     return {
-        "total_scrape_jobs": len(active_jobs),
+        "total_scrape_jobs": len(scrape_jobs),
         "scrape_jobs": [
             {
                 "job_id": job_id,
@@ -494,85 +969,30 @@ async def list_scrape_jobs():
                 "completed_at": job.get("completed_at"),
                 "results": job.get("results")
             }
-            for job_id, job in active_jobs.items()
+            for job_id, job in scrape_jobs.items()
         ]
     }
 
 @app.get("/latest")
-async def get_latest_jobs():
+def get_latest_jobs():
     """Get all jobs from the last 24 hours from S3 batch files, sorted by date"""
     try:
-        # Try to read from S3 batch files first
-        all_jobs = []
-        try:
-            import boto3
-            from datetime import datetime, timezone, timedelta
-            
-            s3_client = boto3.client('s3')
-            bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
-            
-            # Get today's date for the S3 path
-            today = datetime.now(timezone.utc).date()
-            prefix = f"jobs/hourly/{today}/"
-            
-            # List all batch files for today
-            response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-            
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    if obj['Key'].endswith('.json'):
-                        # Download and parse each batch file
-                        file_obj = s3_client.get_object(Bucket=bucket_name, Key=obj['Key'])
-                        batch_jobs = json.loads(file_obj['Body'].read().decode('utf-8'))
-                        if isinstance(batch_jobs, list):
-                            all_jobs.extend(batch_jobs)
-                        else:
-                            all_jobs.append(batch_jobs)
-            
-            # Remove duplicates based on job_id
-            seen_ids = set()
-            unique_jobs = []
-            for job in all_jobs:
-                job_id = job.get('job_id') or job.get('id')
-                if job_id and job_id not in seen_ids:
-                    seen_ids.add(job_id)
-                    unique_jobs.append(job)
-            all_jobs = unique_jobs
-            
-        except Exception as s3_error:
-            print(f"⚠️ S3 consolidation failed: {s3_error}")
-            # Fallback to local analytics file
-            analytics_file = '/tmp/analytics_historical_jobs.json'
-            if not os.path.exists(analytics_file):
-                return {"message": "No analytics data found", "total_jobs": 0, "last_24h_jobs": 0, "latest_jobs": []}
-            
-            with open(analytics_file, 'r') as f:
-                all_jobs = json.load(f)
-        
-        # Filter to last 24 hours
-        from datetime import timedelta, timezone
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
-        last_24h_jobs = []
+        # Read from S3 (hourly batches) or local analytics fallback
+        snapshot = load_jobs_snapshot()
+        all_jobs = snapshot.data
+        if not all_jobs:
+            return {"message": "No analytics data found", "total_jobs": 0, "last_24h_jobs": 0, "latest_jobs": []}
         
-        for job in all_jobs:
-            # Check if job was posted in the last 24 hours
-            job_datetime = None
-            if 'posted_dt' in job and job['posted_dt']:
-                try:
-                    # Parse the ISO format datetime
-                    job_datetime = datetime.fromisoformat(job['posted_dt'].replace('Z', '+00:00'))
-                except (ValueError, TypeError):
-                    # Try alternative date fields if posted_dt fails
-                    for date_field in ['listedAt', 'created_at_formatted']:
-                        if date_field in job and job[date_field]:
-                            try:
-                                job_datetime = datetime.fromisoformat(job[date_field].replace('Z', '+00:00'))
-                                break
-                            except (ValueError, TypeError):
-                                continue
-            
-            if job_datetime and job_datetime >= cutoff_time:
-                last_24h_jobs.append(job)
+        # Filter to last 24 hours using the hour-bucket index
+        from datetime import timezone
+        cutoff = int(time.time()) - 24 * 3600
+        cutoff_time = datetime.fromtimestamp(cutoff, tz=timezone.utc)
+        hour_index = snapshot.jobs_by_hour
+        last_24h_jobs = [
+            job
+            for hour, bucket in hour_index.items() if hour >= cutoff // 3600
+            for job in bucket if job['_posted_epoch'] >= cutoff
+        ]
         
         # Sort jobs by posted date (most recent first)
         last_24h_jobs_sorted = sorted(last_24h_jobs, key=lambda x: x.get('posted_dt', ''), reverse=True)
@@ -581,7 +1001,7 @@ async def get_latest_jobs():
             "total_jobs": len(all_jobs),
             "last_24h_jobs": len(last_24h_jobs_sorted),
             "latest_jobs": last_24h_jobs_sorted,
-            "data_source": "s3_batch_files" if 's3_client' in locals() else "analytics_historical_jobs.json",
+            "data_source": "s3_or_local",
             "retention": "accumulating",
             "time_filter": "last_24_hours",
             "cutoff_time": cutoff_time.isoformat(),
@@ -599,38 +1019,33 @@ async def get_latest_jobs():
         }
 
 @app.post("/filter")
-async def filter_jobs(request: FilterRequest):
+def filter_jobs(request: FilterRequest):
     """Filter jobs by experience level, job type, workplace type from analytics data"""
     try:
-        # Read from S3 (hourly batches) or local analytics fallback
-        all_jobs = read_s3_hourly_batches_or_local_analytics()
+        # Read from S3 (hourly batches) or local analytics fallback; positions in the
+        # filter index are only valid against the list from the same snapshot
+        snapshot = load_jobs_snapshot()
+        all_jobs = snapshot.data
         if not all_jobs:
             return {"message": "No analytics data found", "total_jobs": 0, "filtered_jobs": []}
         
-        # Filter jobs based on request parameters
-        filtered_jobs = []
-        
-        for job in all_jobs:
-            # Check experience level filter (use human-readable labels directly)
-            if request.experience_level:
-                if job.get('experience_level') != request.experience_level:
-                    continue
-            
-            # Check job type filter (use human-readable labels directly)
-            if request.job_type:
-                if job.get('job_type_label') != request.job_type:
-                    continue
-            
-            # Check workplace type filter (use human-readable labels directly)
-            if request.workplace_type:
-                if job.get('workplace_type_label') != request.workplace_type:
-                    continue
-            
-            filtered_jobs.append(job)
-        
-        # Apply limit
+        # Intersect the per-label posting lists instead of scanning every job
         limit = request.limit or 50
-        filtered_jobs = filtered_jobs[:limit]
+        filter_index = snapshot.filter_index
+        wanted = zip(FILTER_FIELDS, (request.experience_level, request.job_type, request.workplace_type))
+        filters = [(field, value) for field, value in wanted if value]
+        if filters:
+            # Walk the shortest (already ordered) posting list, check the other
+            # fields on the job itself, and stop as soon as `limit` match
+            field, value = min(filters, key=lambda fv: len(filter_index[fv[0]].get(fv[1], ())))
+            rest = [(f, v) for f, v in filters if f != field]
+            matches = (
+                all_jobs[i] for i in filter_index[field].get(value, ())
+                if all(all_jobs[i].get(f) == v for f, v in rest)
+            )
+            filtered_jobs = list(itertools.islice(matches, limit))
+        else:
+            filtered_jobs = all_jobs[:limit]
         
         return {
             "total_jobs": len(all_jobs),
@@ -678,51 +1093,20 @@ async def get_batch_info():
     }
 
 @app.get("/filters")
-async def get_available_filters():
+def get_available_filters():
     """Get available filter options and current job distribution from analytics data"""
     try:
         # Read from S3 (hourly batches) or local analytics fallback
-        jobs = read_s3_hourly_batches_or_local_analytics()
-        if not jobs:
+        snapshot = load_jobs_snapshot()
+        if not snapshot.data:
             return {"message": "No analytics data found", "filters": {}}
         
-        # Count jobs by each filter category
-        exp_counts = {}
-        job_type_counts = {}
-        workplace_counts = {}
-        
-        for job in jobs:
-            # Experience level counts (use human-readable labels directly)
-            exp_label = job.get('experience_level', 'unknown')
-            exp_counts[exp_label] = exp_counts.get(exp_label, 0) + 1
-            
-            # Job type counts (use human-readable labels directly)
-            jt_label = job.get('job_type_label', 'unknown')
-            job_type_counts[jt_label] = job_type_counts.get(jt_label, 0) + 1
-            
-            # Workplace type counts (use human-readable labels directly)
-            wt_label = job.get('workplace_type_label', 'unknown')
-            workplace_counts[wt_label] = workplace_counts.get(wt_label, 0) + 1
-        
-        return {
-            "total_jobs": len(jobs),
-            "filters": {
-                "experience_levels": {
-                    "options": ["intern", "entry", "associate", "mid-senior", "director", "executive"],
-                    "counts": exp_counts
-                },
-                "job_types": {
-                    "options": ["internship", "full_time", "contract", "temporary", "part_time", "volunteer", "other"],
-                    "counts": job_type_counts
-                },
-                "workplace_types": {
-                    "options": ["remote", "on_site", "hybrid"],
-                    "counts": workplace_counts
-                }
-            },
-            "data_source": "s3_or_local",
-            "timestamp": datetime.now().isoformat()
-        }
+        # The filters object is encoded once per data load; only the envelope
+        # (job total and timestamp) is assembled per request, from the same snapshot
+        body = b'{"total_jobs":%d,"filters":%s,"data_source":"s3_or_local","timestamp":"%s"}' % (
+            len(snapshot.data), snapshot.filters_body, datetime.now().isoformat().encode()
+        )
+        return Response(body, media_type="application/json")
         
     except Exception as e:
         print(f"❌ Error in /filters endpoint: {e}")
@@ -738,7 +1122,7 @@ async def get_available_filters():
 # ============================================================================
 
 @app.get("/companies/tiers")
-async def get_company_tier_distribution():
+def get_company_tier_distribution():
     """Get the tier distribution of companies across all scraped jobs."""
     if not COMPANY_TIERS_AVAILABLE:
         raise HTTPException(status_code=503, detail="Company tier system not available")
@@ -752,8 +1136,8 @@ async def get_company_tier_distribution():
     jobs_by_tier = defaultdict(list)
 
     for job in all_jobs:
-        company = job.get("company_name", "N/A")
-        if company == "N/A":
+        company = job.get("company_name")
+        if not company or company == "N/A":  # older batches used an "N/A" sentinel
             continue
         if company not in companies_seen:
             tier = job.get("company_tier") or get_company_tier(company)
@@ -786,14 +1170,14 @@ async def get_company_tier_distribution():
 
 
 @app.get("/companies/rank")
-async def rank_single_company(name: str):
+def rank_single_company(name: str):
     """Get the tier and score breakdown for a specific company."""
     if not COMPANY_TIERS_AVAILABLE:
         raise HTTPException(status_code=503, detail="Company tier system not available")
 
     # Gather job data for this company from analytics
     all_jobs = read_s3_hourly_batches_or_local_analytics()
-    company_jobs = [j for j in all_jobs if j.get("company_name", "").lower() == name.lower()]
+    company_jobs = [j for j in all_jobs if (j.get("company_name") or "").lower() == name.lower()]
 
     score_data = quick_score(name, jobs=company_jobs)
     score_data["jobs_found"] = len(company_jobs)
@@ -802,7 +1186,7 @@ async def rank_single_company(name: str):
 
 
 @app.get("/companies/top")
-async def get_top_companies(
+def get_top_companies(
     tier: Optional[str] = None,
     limit: int = 50,
     sort_by: str = "job_count",
@@ -821,8 +1205,8 @@ async def get_top_companies(
     # Aggregate by company
     company_data = defaultdict(lambda: {"jobs": [], "tier": "T5_UNRANKED"})
     for job in all_jobs:
-        company = job.get("company_name", "N/A")
-        if company == "N/A":
+        company = job.get("company_name")
+        if not company or company == "N/A":  # older batches used an "N/A" sentinel
             continue
         company_data[company]["jobs"].append(job)
         # Use existing tier from job data, or compute
@@ -864,7 +1248,7 @@ async def get_top_companies(
 
 
 @app.post("/companies/rank-batch")
-async def rank_batch_companies(company_names: List[str]):
+def rank_batch_companies(company_names: List[str]):
     """Rank a batch of companies and return sorted results."""
     if not COMPANY_TIERS_AVAILABLE:
         raise HTTPException(status_code=503, detail="Company tier system not available")
@@ -875,8 +1259,8 @@ async def rank_batch_companies(company_names: List[str]):
     all_jobs = read_s3_hourly_batches_or_local_analytics()
     jobs_by_company = defaultdict(list)
     for job in all_jobs:
-        company = job.get("company_name", "N/A")
-        if company != "N/A":
+        company = job.get("company_name")
+        if company and company != "N/A":
             jobs_by_company[company.lower()].append(job)
 
     results = []
@@ -898,29 +1282,42 @@ async def rank_batch_companies(company_names: List[str]):
 # Helper functions to convert codes to labels
 def get_exp_label(code: str) -> str:
     """Convert experience level code to label"""
-    exp_labels = {"1": "intern", "2": "entry", "3": "associate", "4": "mid-senior", "5": "director", "6": "executive"}
-    return exp_labels.get(code, "unknown")
+    return EXP_LABEL.get(code, "unknown")
 
 def get_job_type_label(code: str) -> str:
     """Convert job type code to label"""
-    jt_labels = {"I": "internship", "F": "full_time", "C": "contract", "T": "temporary", "P": "part_time", "V": "volunteer", "O": "other"}
-    return jt_labels.get(code, "unknown")
+    return JT_LABEL.get(code, "unknown")
 
 def get_workplace_type_label(code: str) -> str:
     """Convert workplace type code to label"""
-    wt_labels = {"1": "on_site", "2": "remote", "3": "hybrid"}
-    return wt_labels.get(code, "unknown")
+    return WT_LABEL.get(code, "unknown")
 
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     print("🚀 Starting LinkedIn Scraper API")
     print("📖 API docs: http://localhost:8000/docs")
     print("�� Health check: http://localhost:8000/health")
     
-    uvicorn.run(
-        "simple_api:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+    if os.getenv("DEV"):
+        # Single process with auto-reload for local development
+        uvicorn.run("simple_api:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # One process per worker, each with its own GIL, so a slow /filter no
+        # longer stalls /health. Equivalent gunicorn setup:
+        #   gunicorn simple_api:app -k uvicorn.workers.UvicornWorker \
+        #       -w $((2 * $(nproc) + 1)) --bind 0.0.0.0:8000
+        # uvloop/httptools ship with uvicorn[standard].
+        workers = int(os.getenv("WEB_CONCURRENCY", str(2 * (os.cpu_count() or 1) + 1)))
+        uvicorn.run(
+            "simple_api:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=workers,
+            backlog=4096,  # absorb probe bursts instead of dropping SYNs
+            limit_concurrency=1000,  # shed load with 503s before memory runs out
+        )
@@ -89,7 +89,7 @@ def generate_cover_letter(
         return CoverLetterResponse(
             job_id=job_id,
             job_title=job.get("title", "Unknown"),
-            company_name=job.get("company_name", "Unknown"),
+            company_name=job.get("company_name") or "Unknown",
             cover_letter=cached,
             cached=True,
         )
@@ -114,7 +114,7 @@ Resume excerpt:
 
 JOB:
 Title: {job.get('title', 'Unknown')}
-Company: {job.get('company_name', 'Unknown')}
+Company: {job.get('company_name') or 'Unknown'}
 Location: {job.get('formatted_location', 'Not specified')}
 Description: {(job.get('description') or '')[:1500]}
 Required Skills: {job.get('skills_description', 'Not specified')}
@@ -129,7 +129,7 @@ Write the cover letter directly — no preamble, no sign-off instructions."""
     return CoverLetterResponse(
         job_id=job_id,
         job_title=job.get("title", "Unknown"),
-        company_name=job.get("company_name", "Unknown"),
+        company_name=job.get("company_name") or "Unknown",
         cover_letter=cover_letter,
         cached=False,
     )
@@ -163,7 +163,7 @@ RESUME:
 
 JOB:
 Title: {job.get('title', 'Unknown')}
-Company: {job.get('company_name', 'Unknown')}
+Company: {job.get('company_name') or 'Unknown'}
 Required Skills: {job.get('skills_description', 'Not specified')}
 Description: {(job.get('description') or '')[:1500]}
 
@@ -181,7 +181,7 @@ Return a JSON object:
     result = ResumeTailorResponse(
         job_id=job_id,
         job_title=job.get("title", "Unknown"),
-        company_name=job.get("company_name", "Unknown"),
+        company_name=job.get("company_name") or "Unknown",
         suggestions=data.get("suggestions", []),
         missing_keywords=data.get("missing_keywords", []),
     )
@@ -230,7 +230,7 @@ Summary: {profile.summary or 'Not provided'}
 Resume excerpt: {resume_text[:1000]}
 
 JOB:
-Title: {job.get('title', 'Unknown')} at {job.get('company_name', 'Unknown')}
+Title: {job.get('title', 'Unknown')} at {job.get('company_name') or 'Unknown'}
 
 QUESTION: {question}
 
@@ -277,7 +277,7 @@ Resume excerpt: {resume_text[:1500]}
 
 JOB:
 Title: {job.get('title', 'Unknown')}
-Company: {job.get('company_name', 'Unknown')}
+Company: {job.get('company_name') or 'Unknown'}
 Location: {job.get('formatted_location', 'Not specified')}
 Experience Level: {job.get('experience_level', 'Not specified')}
 Skills: {job.get('skills_description', 'Not specified')}
@@ -297,7 +297,7 @@ Return JSON:
     result = FitSummaryResponse(
         job_id=job_id,
         job_title=job.get("title", "Unknown"),
-        company_name=job.get("company_name", "Unknown"),
+        company_name=job.get("company_name") or "Unknown",
         fit_score=float(data.get("fit_score", 50)),
         summary=data.get("summary", "Analysis completed"),
         strengths=data.get("strengths", []),
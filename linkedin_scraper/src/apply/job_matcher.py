@@ -15,6 +15,9 @@ try:
 except ImportError:
     RAPIDFUZZ_AVAILABLE = False
 
+WORD_RE = re.compile(r'\b\w{3,}\b')
+SALARY_RE = re.compile(r'[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:K|k)?')
+
 
 class JobMatcher:
     """Scores scraped jobs against a user profile's preferences."""
@@ -37,7 +40,7 @@ class JobMatcher:
         return ScoredJob(
             job_id=str(job.get("job_id", "")),
             title=job.get("title", "Unknown"),
-            company_name=job.get("company_name", "Unknown"),
+            company_name=job.get("company_name") or "Unknown",
             overall_score=round(overall, 1),
             breakdown=JobScoreBreakdown(
                 skills_score=round(skills, 1),
@@ -97,13 +100,15 @@ class JobMatcher:
         if RAPIDFUZZ_AVAILABLE:
             # Use fuzzy matching for better recall
             matched = 0
+            words = None
             for skill in self.skills_lower:
                 # Check exact substring match first
                 if skill in job_text:
                     matched += 1
                 else:
-                    # Fuzzy match against job text words
-                    words = re.findall(r'\b\w{3,}\b', job_text)
+                    # Fuzzy match against job text words (tokenized once per job, not per skill)
+                    if words is None:
+                        words = WORD_RE.findall(job_text)
                     best = process.extractOne(skill, words, scorer=fuzz.ratio)
                     if best and best[1] >= 80:
                         matched += 1
@@ -215,7 +220,7 @@ class JobMatcher:
             return 5.0  # No salary info, neutral
 
         # Extract salary numbers from text
-        numbers = re.findall(r'[\$]?\s*([\d,]+(?:\.\d+)?)\s*(?:K|k)?', salary_text)
+        numbers = SALARY_RE.findall(salary_text)
         if not numbers:
             return 5.0
 
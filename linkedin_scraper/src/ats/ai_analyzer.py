@@ -95,7 +95,7 @@ Full resume text:
 
 JOB POSTING:
 Title: {job.get('title', 'Unknown')}
-Company: {job.get('company_name', 'Unknown')}
+Company: {job.get('company_name') or 'Unknown'}
 Location: {job.get('formatted_location', 'Not specified')}
 Experience Level: {job.get('experience_level', 'Not specified')}
 Workplace Type: {job.get('workplace_type_label', 'Not specified')}
@@ -162,7 +162,7 @@ async def analyze_resume_job_fit(
         resume_id=resume.resume_id,
         job_id=str(job.get("job_id", "")),
         job_title=job.get("title", "Unknown"),
-        company_name=job.get("company_name", "Unknown"),
+        company_name=job.get("company_name") or "Unknown",
         overall_assessment=data.get("overall_assessment", "Analysis completed"),
         fit_score=float(data.get("fit_score", 50)),
         strengths=data.get("strengths", []),
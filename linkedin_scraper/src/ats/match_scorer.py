@@ -46,6 +46,10 @@ STOPWORDS: Set[str] = {
     "well", "new", "years", "year", "knowledge", "understanding",
 }
 
+# Tokenizers, compiled once (batch_score runs every scorer for each job)
+WORD_RE = re.compile(r"\b\w{3,}\b")
+LONG_WORD_RE = re.compile(r"\b\w{4,}\b")
+
 
 # ---------------------------------------------------------------------------
 # Component Scorers
@@ -88,13 +92,13 @@ def compute_experience_score(resume: ParsedResume, job: dict) -> float:
 
     # 1. Title relevance (up to 50 points)
     job_title = (job.get("title") or "").lower()
-    job_title_words = set(re.findall(r"\b\w{3,}\b", job_title)) - STOPWORDS
+    job_title_words = set(WORD_RE.findall(job_title)) - STOPWORDS
 
     if job_title_words and resume.work_experience:
         best_title_score = 0.0
         for exp in resume.work_experience:
             exp_title = exp.title.lower()
-            exp_title_words = set(re.findall(r"\b\w{3,}\b", exp_title)) - STOPWORDS
+            exp_title_words = set(WORD_RE.findall(exp_title)) - STOPWORDS
             if exp_title_words:
                 overlap = len(job_title_words & exp_title_words) / len(job_title_words)
                 best_title_score = max(best_title_score, overlap)
@@ -108,14 +112,14 @@ def compute_experience_score(resume: ParsedResume, job: dict) -> float:
         if job.get(field):
             job_desc_parts.append(job[field])
     job_desc = " ".join(job_desc_parts).lower()
-    job_desc_words = set(re.findall(r"\b\w{3,}\b", job_desc)) - STOPWORDS
+    job_desc_words = set(WORD_RE.findall(job_desc)) - STOPWORDS
 
     if job_desc_words and resume.work_experience:
         resume_exp_text = " ".join(
             (exp.description or "") + " " + exp.title
             for exp in resume.work_experience
         ).lower()
-        resume_exp_words = set(re.findall(r"\b\w{3,}\b", resume_exp_text)) - STOPWORDS
+        resume_exp_words = set(WORD_RE.findall(resume_exp_text)) - STOPWORDS
 
         if resume_exp_words:
             overlap = len(job_desc_words & resume_exp_words) / len(job_desc_words)
@@ -196,13 +200,13 @@ def compute_education_score(resume: ParsedResume, job: dict) -> float:
         score += 15.0
 
     # Field relevance (up to 40 points)
-    edu_keywords = set(re.findall(r"\b\w{4,}\b", edu_desc)) - STOPWORDS
+    edu_keywords = set(LONG_WORD_RE.findall(edu_desc)) - STOPWORDS
     if edu_keywords:
         resume_edu_text = " ".join(
             (e.field_of_study or "") + " " + (e.degree or "") + " " + e.institution
             for e in resume.education
         ).lower()
-        resume_edu_words = set(re.findall(r"\b\w{4,}\b", resume_edu_text)) - STOPWORDS
+        resume_edu_words = set(LONG_WORD_RE.findall(resume_edu_text)) - STOPWORDS
 
         if resume_edu_words:
             overlap = len(edu_keywords & resume_edu_words) / len(edu_keywords)
@@ -227,13 +231,13 @@ def compute_keyword_density(resume_text: str, job: dict) -> float:
         job_parts.extend(job["job_functions"])
 
     job_text = " ".join(job_parts).lower()
-    job_words = set(re.findall(r"\b\w{3,}\b", job_text)) - STOPWORDS
+    job_words = set(WORD_RE.findall(job_text)) - STOPWORDS
 
     if not job_words:
         return 50.0
 
     resume_lower = resume_text.lower()
-    resume_words = set(re.findall(r"\b\w{3,}\b", resume_lower)) - STOPWORDS
+    resume_words = set(WORD_RE.findall(resume_lower)) - STOPWORDS
 
     if not resume_words:
         return 0.0
@@ -322,7 +326,7 @@ def score_match(resume: ParsedResume, job: dict) -> MatchResult:
     return MatchResult(
         job_id=str(job.get("job_id", "")),
         job_title=job.get("title", "Unknown"),
-        company_name=job.get("company_name", "Unknown"),
+        company_name=job.get("company_name") or "Unknown",
         overall_score=round(overall, 1),
         breakdown=breakdown,
         keyword_gap=keyword_gap,
@@ -4,27 +4,66 @@ LinkedIn Job Scraper - API-Only Approach
 Uses LinkedIn's internal API for fast and reliable job scraping
 """
 
-import pickle
 import time
 import json
+import orjson
 import re
 import random
 import asyncio
+import functools
 import aiohttp
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from collections import defaultdict
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Optional
 import threading
+import sqlite3
 import os
+import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# Log through a queue so a slow terminal never stalls the event loop; a listener thread does the writes
+logger = logging.getLogger('scraper')
+if not logger.handlers:
+    _log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _stream_handler = logging.StreamHandler(sys.stdout)
+    _stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    # SCRAPER_DEBUG=1 adds per-shard/per-page detail; otherwise debug calls stop at the level check
+    logger.setLevel(logging.DEBUG if os.getenv('SCRAPER_DEBUG') == '1' else logging.INFO)
+    logger.propagate = False
 
 # Use /tmp in Lambda (working dir /var/task is read-only)
-COOKIE_FILE = '/tmp/li_cookies.pkl' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'li_cookies.pkl'
-import sys
+COOKIE_FILE = '/tmp/li_cookies.json' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'li_cookies.json'
+# Parsed job details survive between runs (and warm Lambda invocations) for DETAIL_CACHE_TTL seconds; 0 disables
+DETAIL_CACHE_FILE = '/tmp/job_details_cache.sqlite' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else '.job_details_cache.sqlite'
+DETAIL_CACHE_TTL = int(os.getenv('DETAIL_CACHE_TTL', '3600'))
+COOKIE_S3_KEY = "cookies/li_cookies.json"
+LEGACY_COOKIE_S3_KEY = "cookies/li_cookies.pkl"  # Read only until the JSON object exists
 
 # Add parent directory to path for company_tracker imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Brotli is optional; only advertise br when we can decode it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# ijson (C backend when built) lets large detail payloads be parsed only up to the part we need
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Company tier system — import with graceful fallback
 try:
     from company_tracker.company_ranker import quick_score, get_company_tier
@@ -48,75 +87,127 @@ WT_LABEL = {"1": "on_site", "2": "remote", "3": "hybrid"}
 
 # Performance configuration
 CONCURRENT_WORKERS = 3  # Reduced from 10
+SHARD_CONCURRENCY = 3  # Shards scraped at once (each with its own CONCURRENT_WORKERS detail slots)
 MAX_PAGES_PER_SHARD = 5  # Reduced from 5
 API_TIMEOUT = 30  # Increased from 15
 JOB_DETAIL_TIMEOUT = 20  # Increased from 10
+RETRY_TOTAL = 3  # Retries per request on throttling / transient server errors
+RETRY_BACKOFF = 0.5  # Seconds; doubles on each retry
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504, 999})
+MAX_RETRY_AFTER = 60  # Seconds; cap on a server-provided Retry-After
+RETRY_BUDGET = 90  # Seconds; wall-clock limit on one request including all its retries
 
-# Rate limiting configuration
-BASE_DELAY = 2.0  # Increased from 1.0
-MIN_DELAY = 1.0   # Increased from 0.3
-MAX_DELAY = 8.0   # Increased from 5.0
-BREAK_INTERVAL = 5  # More frequent breaks (was 10)
+# Rate limiting configuration (AIMD token bucket shared by every LinkedIn request in a run)
+BASE_RATE = 5.0   # Requests per second to start from
+MIN_RATE = 0.5    # Floor after repeated throttling
+MAX_RATE = 10.0   # Ceiling for the additive ramp-up
+RATE_DECREASE = 0.7  # Multiplicative decrease on 429/999
+RATE_INCREASE = 0.1  # Additive increase per successful request
+THROTTLE_STATUSES = frozenset({429, 999})  # 999 is LinkedIn's bot-detection response
+STREAM_PARSE_MIN_BYTES = 64 * 1024  # Bodies at least this large (or of unknown size) are stream-parsed when ijson is available
 
 # Blacklist companies
-BLACKLIST_RE = re.compile(
-    r"(jobright|jooble|talent\.com|ziprecruiter|lensa|adzuna|simplyhired|neuvoo|jora|"
-    r"glassdoor|jobs2careers|myjobhelper|careerbuilder|monster|snagajob|"
-    r"insight global|teksystems|kforce|aerotek|randstad|robert half|apex systems|experis|actalent)",
-    re.I
+BLACKLIST_COMPANIES = (
+    "jobright", "jooble", "talent.com", "ziprecruiter", "lensa", "adzuna", "simplyhired", "neuvoo", "jora",
+    "glassdoor", "jobs2careers", "myjobhelper", "careerbuilder", "monster", "snagajob",
+    "insight global", "teksystems", "kforce", "aerotek", "randstad", "robert half", "apex systems", "experis", "actalent",
+)
+
+# Numeric job id inside a jobPosting/jobPostingCard URN, e.g. urn:li:fsd_jobPostingCard:(4287995271,JOBS_SEARCH)
+JOB_ID_RE = re.compile(r'jobPosting(?:Card)?:\(?(\d+)')
+
+# Voyager job search (listing) endpoint; formatted once per shard, the page offset is appended per page
+_VOYAGER_URL = (
+    'https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards'
+    '?decorationId=com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollectionLite-88'
+    '&count={count}&q=jobSearch'
+    '&query=(currentJobId:4289275995,origin:JOB_SEARCH_PAGE_JOB_FILTER,keywords:{keywords},'
+    'locationUnion:(geoId:103644278),'
+    'selectedFilters:(distance:List(25),experience:List({exp}),jobType:List({jt}),'
+    'workplaceType:List({wt}),timePostedRange:List({tf})),spellCorrectionEnabled:true)'
+    '&servedEventEnabled=false&start='
 )
 
 class AdaptiveRateLimiter:
-    """Adaptive rate limiter that adjusts delays based on response patterns"""
+    """Async token bucket whose rate adapts AIMD-style to LinkedIn's responses.
+
+    Every request awaits acquire(); the rate ramps up additively on success and is
+    cut multiplicatively when LinkedIn throttles, so there is no dead air between shards.
+    """
     
-    def __init__(self, base_delay=BASE_DELAY, max_delay=MAX_DELAY, min_delay=MIN_DELAY):
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.min_delay = min_delay
-        self.current_delay = base_delay
+    def __init__(self, rate=BASE_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
         self.error_count = 0
         self.success_count = 0
-        self.response_times = []
+        self._lock = None  # Created in acquire(), inside the loop that uses it
     
-    def record_success(self, response_time=None):
-        """Record a successful request"""
+    def _refill(self):
+        now = time.monotonic()
+        # Capacity of one token: requests are spaced out rather than sent in bursts
+        self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self):
+        """Wait for a request slot"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1.0:
+                # Small jitter keeps the request spacing from looking mechanical
+                await asyncio.sleep((1.0 - self.tokens) / self.rate * random.uniform(1.0, 1.2))
+                self._refill()
+            self.tokens -= 1.0
+    
+    def record_success(self):
+        """Record a successful request and ramp the rate up"""
         self.success_count += 1
-        if response_time:
-            self.response_times.append(response_time)
-            # Keep only last 10 response times
-            if len(self.response_times) > 10:
-                self.response_times.pop(0)
-        
-        # Gradually decrease delay on success
-        if self.success_count % 3 == 0:  # Every 3 successes
-            self.current_delay = max(self.min_delay, self.current_delay * 0.9)
+        self.rate = min(self.max_rate, self.rate + RATE_INCREASE)
     
     def record_error(self):
-        """Record an error and increase delay"""
+        """Record a throttled request and cut the rate"""
         self.error_count += 1
-        # Increase delay on error
-        self.current_delay = min(self.max_delay, self.current_delay * 1.5)
-    
-    def get_delay(self):
-        """Get current delay with some randomization"""
-        return random.uniform(self.current_delay * 0.8, self.current_delay * 1.2)
-    
-    def get_break_delay(self):
-        """Get longer delay for strategic breaks"""
-        return random.uniform(self.current_delay * 1.2, self.current_delay * 1.5)
+        self.rate = max(self.min_rate, self.rate * RATE_DECREASE)
+
+def _read_cookie_file(path):
+    """Read a cookie list saved by login.py ({"cookies": [...]})"""
+    with open(path) as f:
+        data = json.load(f)
+    return data.get('cookies') if isinstance(data, dict) else data
+
+
+def _migrate_legacy_cookies(s3_client, bucket_name):
+    """One-time migration: convert cookies still stored as a pickle to JSON and upload them to COOKIE_S3_KEY"""
+    import pickle
+    legacy_file = COOKIE_FILE + '.pkl'
+    s3_client.download_file(bucket_name, LEGACY_COOKIE_S3_KEY, legacy_file)
+    try:
+        with open(legacy_file, 'rb') as f:
+            cookies = pickle.load(f)
+    finally:
+        os.remove(legacy_file)
+    if cookies:
+        with open(COOKIE_FILE, 'w') as f:
+            json.dump({'cookies': cookies}, f)
+        s3_client.upload_file(COOKIE_FILE, bucket_name, COOKIE_S3_KEY)
+        logger.info("✅ Migrated legacy pickled cookies to JSON in S3")
+    return cookies
 
 def load_cookies():
     """Load saved cookies from local file or S3"""
     try:
-        with open(COOKIE_FILE, 'rb') as f:
-            cookies = pickle.load(f)
-            if cookies:
-                print("✅ Loaded cookies from local file")
-                return cookies
-    except (FileNotFoundError, EOFError, pickle.UnpicklingError) as e:
-        print(f"❌ Local cookie file issue: {e}")
+        cookies = _read_cookie_file(COOKIE_FILE)
+        if cookies:
+            logger.info("✅ Loaded cookies from local file")
+            return cookies
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.info(f"❌ Local cookie file issue: {e}")
 
-    print("❌ No local cookies found. Checking S3...")
+    logger.info("❌ No local cookies found. Checking S3...")
 
     # Try to download cookies from S3
     try:
@@ -125,136 +216,278 @@ def load_cookies():
         bucket_name = os.getenv('JOBS_BUCKET', 'linkedin-job-scraper-dev-jobs')
         if bucket_name:
             s3_client = boto3.client('s3')
-            s3_key = "cookies/li_cookies.pkl"
 
             # Check if file exists in S3 first
             try:
-                s3_client.head_object(Bucket=bucket_name, Key=s3_key)
-                print("✅ Found cookies in S3, downloading...")
+                s3_client.head_object(Bucket=bucket_name, Key=COOKIE_S3_KEY)
+                logger.info("✅ Found cookies in S3, downloading...")
 
                 # Download cookies from S3 (use /tmp in Lambda)
-                s3_client.download_file(bucket_name, s3_key, COOKIE_FILE)
-                print("✅ Cookies downloaded from S3")
+                s3_client.download_file(bucket_name, COOKIE_S3_KEY, COOKIE_FILE)
+                logger.info("✅ Cookies downloaded from S3")
 
                 # Load the downloaded cookies
-                with open(COOKIE_FILE, 'rb') as f:
-                    cookies = pickle.load(f)
+                cookies = _read_cookie_file(COOKIE_FILE)
+                if cookies:
+                    logger.info("✅ Successfully loaded cookies from S3")
+                    return cookies
+                else:
+                    logger.info("❌ Downloaded cookies file is empty")
+            except Exception as s3_head_error:
+                logger.info(f"⚠️ S3 head check failed: {s3_head_error}")
+                try:
+                    cookies = _migrate_legacy_cookies(s3_client, bucket_name)
                     if cookies:
-                        print("✅ Successfully loaded cookies from S3")
                         return cookies
-                    else:
-                        print("❌ Downloaded cookies file is empty")
-            except s3_client.exceptions.NoSuchKey:
-                print("❌ No cookies found in S3")
-            except Exception as s3_head_error:
-                print(f"⚠️ S3 head check failed: {s3_head_error}")
+                except Exception as legacy_error:
+                    logger.info(f"❌ No legacy cookies in S3 either: {legacy_error}")
 
     except Exception as s3_error:
-        print(f"⚠️ S3 cookie download failed: {s3_error}")
+        logger.info(f"⚠️ S3 cookie download failed: {s3_error}")
 
-    print("❌ No saved cookies found. Please run login.py first.")
+    logger.info("❌ No saved cookies found. Please run login.py first.")
     return None
 
 def setup_session():
     """Setup API session with cookies"""
-    print("🔧 Setting up API session...")
+    logger.info("🔧 Setting up API session...")
     
     # Try to load existing cookies first
     cookies = load_cookies()
     if not cookies:
         # In Lambda there is no browser — cannot auto-login
         if os.getenv('AWS_LAMBDA_FUNCTION_NAME'):
-            print("❌ No cookies available in Lambda. Refresh via GitHub Actions or locally and upload to S3.")
+            logger.info("❌ No cookies available in Lambda. Refresh via GitHub Actions or locally and upload to S3.")
             return None
-        print("❌ No saved cookies found. Attempting to login...")
+        logger.info("❌ No saved cookies found. Attempting to login...")
         # Try to login automatically (local/CI only)
         try:
-            from login import login_and_save_cookies
+            from login import login_and_save_cookies, close_driver
             email = os.getenv('LINKEDIN_EMAIL')
             password = os.getenv('LINKEDIN_PASSWORD')
             if email and password:
-                login_and_save_cookies(email, password)
+                try:
+                    login_and_save_cookies(email, password)
+                finally:
+                    # The scrape itself is HTTP-only; don't keep Chrome alive for the whole run
+                    close_driver()
                 cookies = load_cookies()
                 if cookies:
-                    print("✅ Auto-login successful!")
+                    logger.info("✅ Auto-login successful!")
                 else:
-                    print("❌ Auto-login failed.")
+                    logger.info("❌ Auto-login failed.")
                     return None
             else:
-                print("❌ No LinkedIn credentials found in environment variables.")
+                logger.info("❌ No LinkedIn credentials found in environment variables.")
                 return None
         except Exception as e:
-            print(f"❌ Auto-login failed: {e}")
+            logger.info(f"❌ Auto-login failed: {e}")
             return None
     
-    # Create requests session directly with existing cookies
+    # The requests session only carries headers and cookies into make_async_session;
+    # connection pooling and retries live on the aiohttp side (TCPConnector, fetch_json)
     import requests
     session = requests.Session()
     
-    # Set cookies in the session
-    for cookie in cookies:
-        session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+    # Set cookies in the session in one shot
+    cookie_dict = {cookie['name']: cookie['value'] for cookie in cookies}
+    session.cookies = requests.utils.cookiejar_from_dict(cookie_dict)
     
     # Extract JSESSIONID for CSRF token
-    jsessionid = next((c['value'] for c in cookies if c['name'] == 'JSESSIONID'), '').strip('"')
+    jsessionid = cookie_dict.get('JSESSIONID', '').strip('"')
     if jsessionid.startswith('ajax:'):
         jsessionid = jsessionid[5:]
-    csrf_token = f'ajax:{jsessionid}' if jsessionid else None
+    if not jsessionid:
+        # Voyager rejects requests without a csrf-token, which is derived from JSESSIONID
+        logger.info("❌ Saved cookies have no JSESSIONID (cannot build csrf-token). Re-run login.py to refresh them.")
+        return None
+    csrf_token = f'ajax:{jsessionid}'
     
     # Set headers
     session.headers.update({
         'Accept': 'application/vnd.linkedin.normalized+json+2.1',
         'csrf-token': csrf_token,
         'x-restli-protocol-version': '2.0.0',
+        'Accept-Encoding': ACCEPT_ENCODING,
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36'
     })
     
-    print("✅ Session setup complete using existing cookies")
+    logger.info("✅ Session setup complete using existing cookies")
     return session
 
 
-def get_job_details_concurrent(session, job_ids, max_workers=CONCURRENT_WORKERS):
-    """Get detailed information for multiple jobs concurrently"""
-    def fetch_single_job(job_id):
-        return get_job_details_api(session, job_id)
-    
-    jobs = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all jobs
-        future_to_job_id = {executor.submit(fetch_single_job, job_id): job_id for job_id in job_ids}
+def make_async_session(session, max_workers=CONCURRENT_WORKERS):
+    """Build an aiohttp session carrying the same headers and cookies as `session`.
+
+    Cookies are sent as a raw Cookie header (LinkedIn's quoted JSESSIONID does
+    not survive aiohttp's cookie jar), and one TCPConnector is shared so DNS
+    lookups and TLS connections are reused across every detail request.
+    """
+    # aiohttp manages keep-alive itself; responses are decompressed transparently
+    # (requests silently drops None-valued headers; aiohttp would raise on every request)
+    headers = {k: v for k, v in session.headers.items() if k != 'Connection' and v is not None}
+    headers['Accept-Encoding'] = ACCEPT_ENCODING
+    headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in session.cookies.items())
+    connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300)
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        auto_decompress=True,
+        timeout=aiohttp.ClientTimeout(total=JOB_DETAIL_TIMEOUT),
+    )
+
+
+async def _stream_item(response, path):
+    """Parse the top-level member `path` out of a streamed JSON body.
+
+    Parsing stops at that member and the rest of the body is drained unparsed so the
+    keep-alive connection can be reused. Without such a member the whole top-level
+    object is returned, as the non-streaming path does.
+    """
+    members = {}
+    async for key, value in ijson.kvitems_async(response.content, '', use_float=True):
+        if key == path:
+            item = value
+            break
+        members[key] = value
+    else:
+        item = members or None
+    async for _ in response.content.iter_chunked(64 * 1024):
+        pass
+    return item
+
+
+def _retry_after_seconds(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+async def fetch_json(http, url, rate_limiter=None, item_path=None, budget=RETRY_BUDGET, **kwargs):
+    """GET a Voyager URL and parse the body, retrying 429/5xx, dropped connections and timeouts with backoff.
+
+    Each attempt waits on `rate_limiter` and reports throttling back to it; retries
+    honour the server's Retry-After when it asks for longer than our backoff. With
+    `item_path`, only that top-level member is returned, falling back to the whole
+    top-level object when it is absent (however the body was parsed); large bodies
+    are then stream-parsed with ijson.
+    Retries stop once `budget` seconds have passed, and no backoff sleeps past that deadline.
+    Returns (status, data); data is None unless the final status is 200.
+    """
+    deadline = time.monotonic() + budget
+    for attempt in range(RETRY_TOTAL + 1):
+        if rate_limiter:
+            await rate_limiter.acquire()
+        retry_after = None
+        try:
+            async with http.get(url, **kwargs) as response:
+                status = response.status
+                if status in RETRY_STATUSES:
+                    retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                if rate_limiter:
+                    if status == 200:
+                        rate_limiter.record_success()
+                    elif status in THROTTLE_STATUSES:
+                        rate_limiter.record_error()
+                if status == 200:
+                    if item_path and ijson is not None and \
+                            (response.content_length or STREAM_PARSE_MIN_BYTES) >= STREAM_PARSE_MIN_BYTES:
+                        return status, await _stream_item(response, item_path)
+                    data = orjson.loads(await response.read())
+                    if item_path:
+                        data = data.get(item_path, data) if isinstance(data, dict) else None
+                    return status, data
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):  # timeouts aren't ClientConnectionErrors
+            if attempt == RETRY_TOTAL or time.monotonic() >= deadline:
+                raise
+            status = None
         
-        # Collect results as they complete
-        for future in as_completed(future_to_job_id):
-            job_details = future.result()
-            if job_details and not is_blacklisted(job_details.get('company_name', '')):
-                jobs.append(job_details)
+        remaining = deadline - time.monotonic()
+        if status is not None and (status not in RETRY_STATUSES or attempt == RETRY_TOTAL or remaining <= 0):
+            return status, None
+        await asyncio.sleep(min(max(RETRY_BACKOFF * (2 ** attempt), retry_after or 0), max(remaining, 0)))
+
+
+async def get_job_details_concurrent(http, job_ids, max_workers=CONCURRENT_WORKERS, claimed_ids=None, rate_limiter=None):
+    """Get detailed information for multiple jobs concurrently
+
+    Fresh details come from the local cache, which is read once and written once
+    per batch in a worker thread so SQLite never blocks the event loop.
+    Failed fetches are released from `claimed_ids` so a later shard can retry them.
+    """
+    cache = get_detail_cache()
+    cached = {}
+    if cache:
+        try:
+            cached = await asyncio.to_thread(cache.get_many, job_ids)
+        except sqlite3.Error as e:
+            logger.info(f"⚠️ Job detail cache read failed: {e}")
+    
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_single_job(job_id):
+        async with semaphore:
+            return await get_job_details_api(http, job_id, rate_limiter)
+
+    # One failing fetch (e.g. an unexpected payload) must not discard the rest of the batch
+    to_fetch = [job_id for job_id in job_ids if job_id not in cached]
+    fetched = await asyncio.gather(*[fetch_single_job(job_id) for job_id in to_fetch], return_exceptions=True)
+    fetched = {job_id: None if isinstance(job, Exception) else job for job_id, job in zip(to_fetch, fetched)}
+    
+    new_jobs = [job for job in fetched.values() if job]
+    if cache and new_jobs:
+        try:
+            await asyncio.to_thread(cache.set_many, new_jobs)
+        except sqlite3.Error as e:
+            logger.info(f"⚠️ Job detail cache write failed: {e}")
     
-    return jobs
+    results = [cached.get(job_id) or fetched.get(job_id) for job_id in job_ids]
+    if claimed_ids is not None:
+        claimed_ids.difference_update(job_id for job_id, job in zip(job_ids, results) if job is None)
+    # Listing cards are already screened; this catches names only the detail payload reveals
+    return [job for job in results if job and not is_blacklisted(job.company_name)]
 
-def get_jobs_api(session, keywords, exp_level, job_type, workplace_type, count=100, time_filter='r604800'):
-    """Get jobs from API for specific shard parameters with adaptive pagination"""
+
+async def get_jobs_api(http, keywords, exp_level, job_type, workplace_type, count=100, time_filter='r604800',
+                       claimed_ids=None, repeat_ids=None, rate_limiter=None):
+    """Get jobs from API for specific shard parameters with adaptive pagination
+
+    With `claimed_ids` (shared by every shard in the run), only IDs nobody has claimed
+    yet get a detail request; IDs another shard already owns go to `repeat_ids`.
+    """
     # Validate session first
-    if not session:
-        print("   ❌ No valid session available")
+    if not http:
+        logger.info("   ❌ No valid session available")
         return []
     
     all_jobs = []
     page = 0
     max_pages = MAX_PAGES_PER_SHARD  # Safety limit to prevent infinite loops
+    # Everything but the page offset is fixed for the shard
+    shard_url = _VOYAGER_URL.format(count=count, keywords=keywords, exp=exp_level, jt=job_type, wt=workplace_type,
+                                    tf=time_filter)
     
     while page < max_pages:
         start = page * count
-        url = f'https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?decorationId=com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollectionLite-88&count={count}&q=jobSearch&query=(currentJobId:4289275995,origin:JOB_SEARCH_PAGE_JOB_FILTER,keywords:{keywords},locationUnion:(geoId:103644278),selectedFilters:(distance:List(25),experience:List({exp_level}),jobType:List({job_type}),workplaceType:List({workplace_type}),timePostedRange:List({time_filter})),spellCorrectionEnabled:true)&servedEventEnabled=false&start={start}'
+        url = f'{shard_url}{start}'
         
         try:
-            response = session.get(url, timeout=API_TIMEOUT)
-            if response.status_code != 200:
-                print(f"   ❌ HTTP {response.status_code} on page {page + 1}")
+            status, data = await fetch_json(http, url, rate_limiter, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT))
+            if status != 200:
+                logger.info(f"   ❌ HTTP {status} on page {page + 1}")
                 break
-            
-            data = response.json()
+
             if not data:
-                print(f"   ❌ Empty response on page {page + 1}")
+                logger.info(f"   ❌ Empty response on page {page + 1}")
                 break
                 
             elements = data.get('data', {}).get('elements', [])
@@ -262,17 +495,43 @@ def get_jobs_api(session, keywords, exp_level, job_type, workplace_type, count=1
             if not elements:
                 break
             
-            # Extract job IDs
+            # Company names from the listing cards (normalized responses put the cards in 'included')
+            card_companies = {}
+            for item in data.get('included', ()):
+                item_urn = item.get('entityUrn', '')
+                if 'jobPostingCard' in item_urn:
+                    card_companies[item_urn] = (item.get('primaryDescription') or {}).get('text')
+            
+            # Extract job IDs, skipping blacklisted companies before any detail request
             job_ids = []
             for element in elements:
-                job_card_urn = element.get('jobCardUnion', {}).get('*jobPostingCard', '')
-                job_id_match = re.search(r'(\d+)', job_card_urn)
+                job_card = element.get('jobCardUnion', {})
+                job_card_urn = job_card.get('*jobPostingCard', '')
+                company_name = card_companies.get(job_card_urn) or \
+                    ((job_card.get('jobPostingCard') or {}).get('primaryDescription') or {}).get('text')
+                if is_blacklisted(company_name):
+                    continue
+                job_id_match = JOB_ID_RE.search(job_card_urn)
                 if job_id_match:
                     job_ids.append(job_id_match.group(1))
             
+            # Claim unseen IDs before fetching so concurrent shards never fetch the same job
+            if claimed_ids is not None:
+                fresh_ids = []
+                for job_id in job_ids:
+                    if job_id in claimed_ids:
+                        if repeat_ids is not None:
+                            repeat_ids.append(job_id)
+                    else:
+                        claimed_ids.add(job_id)
+                        fresh_ids.append(job_id)
+                job_ids = fresh_ids
+            
+            logger.debug("   📄 Page %d: %d cards, %d to fetch", page + 1, len(elements), len(job_ids))
+            
             # Fetch job details concurrently
             if job_ids:
-                page_jobs = get_job_details_concurrent(session, job_ids)
+                page_jobs = await get_job_details_concurrent(http, job_ids, claimed_ids=claimed_ids, rate_limiter=rate_limiter)
                 all_jobs.extend(page_jobs)
             
             # Adaptive pagination: only continue if we got exactly 100 jobs (hit the limit)
@@ -282,258 +541,457 @@ def get_jobs_api(session, keywords, exp_level, job_type, workplace_type, count=1
             elif len(elements) == count:
                 # Got exactly 100 jobs, there might be more - continue to next page
                 page += 1
-                time.sleep(1)  # Rate limiting between pages
             else:
                 # Got more than 100 jobs (shouldn't happen), but stop anyway
                 break
             
         except Exception as e:
-            print(f"   ❌ API error on page {page + 1}: {e}")
+            logger.info(f"   ❌ API error on page {page + 1}: {e}")
             break
     
     if page > 0:
-        print(f"   📄 Retrieved {len(all_jobs)} jobs from {page + 1} pages")
+        logger.info(f"   📄 Retrieved {len(all_jobs)} jobs from {page + 1} pages")
     
     return all_jobs
 
-def get_job_details_api(session, job_id):
+class JobDetailCache:
+    """SQLite-backed cache of parsed job details (orjson rows, expired after `ttl` seconds)"""
+    
+    def __init__(self, path=DETAIL_CACHE_FILE, ttl=DETAIL_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS job_details (job_id TEXT PRIMARY KEY, stored_at REAL, record BLOB)')
+        self._conn.execute('DELETE FROM job_details WHERE stored_at < ?', (time.time() - ttl,))
+        self._conn.commit()
+    
+    def get_many(self, job_ids):
+        """Fresh cached records for `job_ids`, keyed by job_id (one query per batch)"""
+        if not job_ids:
+            return {}
+        placeholders = ','.join('?' * len(job_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT job_id, record FROM job_details WHERE stored_at >= ? AND job_id IN ({placeholders})',
+                (time.time() - self.ttl, *job_ids)).fetchall()
+        return {job_id: JobRecord(**orjson.loads(record)) for job_id, record in rows}
+    
+    def set_many(self, jobs):
+        """Store parsed `jobs` in a single transaction"""
+        now = time.time()
+        rows = [(job.job_id, now, orjson.dumps(job, default=_json_default)) for job in jobs]
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO job_details VALUES (?, ?, ?)', rows)
+            self._conn.commit()
+
+_detail_cache = None
+
+def get_detail_cache():
+    """Shared JobDetailCache, opened on first use; None when caching is disabled or unavailable"""
+    global _detail_cache
+    if _detail_cache is None and DETAIL_CACHE_TTL > 0:
+        try:
+            _detail_cache = JobDetailCache()
+        except sqlite3.Error as e:
+            logger.info(f"⚠️ Job detail cache unavailable: {e}")
+            return None
+    return _detail_cache
+
+
+async def get_job_details_api(http, job_id, rate_limiter=None):
     """Get detailed information for a specific job via API"""
     url = f'https://www.linkedin.com/voyager/api/jobs/jobPostings/{job_id}'
     
     try:
-        response = session.get(url, timeout=JOB_DETAIL_TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            job_data = data.get('data', data)
-            
-            title = job_data.get('title', 'N/A')
-            
-            # Enhanced repost detection using timestamp comparison
-            listed_at = job_data.get('listedAt')
-            original_listed_at = job_data.get('originalListedAt')
-            
-            # Use timestamp comparison for accurate repost detection
-            if listed_at and original_listed_at:
-                is_repost = (listed_at != original_listed_at)
-            else:
-                # Fallback to repostedJobPosting field if timestamps unavailable
-                is_repost = job_data.get('repostedJobPosting', False)
-                if is_repost is None:
-                    is_repost = False
-            
-            # Extract posting date
-            posted_dt = None
-            for date_field in ['timeAt', 'listedAt', 'postedAt']:
-                if date_field in job_data:
-                    timestamp = job_data[date_field]
-                    if isinstance(timestamp, (int, float)):
-                        posted_dt = datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).isoformat()
-                        break
-            
-            # Extract company name from URL path segment
-            company_name = 'N/A'
-            url_path = job_data.get('urlPathSegment', '')
-            if url_path:
-                # Extract company name from URL path like "junior-legal-specialist-at-robin-ai-4289326695"
-                parts = url_path.split('-at-')
-                if len(parts) > 1:
-                    company_part = parts[1].split('-')[:-1]  # Remove the job ID at the end
-                    company_name = ' '.join(company_part).title()
-            
-            # Fallback: try companyDetails if URL extraction fails
-            if company_name == 'N/A' and 'companyDetails' in job_data:
-                company_details = job_data['companyDetails']
-                if 'companyName' in company_details:
-                    company_name = company_details['companyName']
-                elif 'company' in company_details and isinstance(company_details['company'], dict):
-                    company_name = company_details['company'].get('name', 'N/A')
-            
-            # Extract apply URL (prefer companyApplyUrl if available)
-            apply_url = f'https://www.linkedin.com/jobs/view/{job_id}/'
-            if 'applyMethod' in job_data:
-                apply_method = job_data['applyMethod']
-                if 'companyApplyUrl' in apply_method:
-                    apply_url = apply_method['companyApplyUrl']
-            
-            # ===== ENHANCED FIELD EXTRACTION =====
-            
-            # EASY FIELDS - Direct Access (21 fields)
-            skills_description = job_data.get('skillsDescription')
-            education_description = job_data.get('educationDescription')
-            formatted_salary_description = job_data.get('formattedSalaryDescription')
-            industries = job_data.get('industries', [])
-            formatted_industries = job_data.get('formattedIndustries', [])
-            source_domain = job_data.get('sourceDomain')
-            formatted_location = job_data.get('formattedLocation')
-            work_remote_allowed = job_data.get('workRemoteAllowed')
-            workplace_types = job_data.get('workplaceTypes', [])
-            benefits = job_data.get('benefits', [])
-            brief_benefits_description = job_data.get('briefBenefitsDescription')
-            inferred_benefits = job_data.get('inferredBenefits', [])
-            employment_status = job_data.get('employmentStatus')
-            formatted_employment_status = job_data.get('formattedEmploymentStatus')
-            job_functions = job_data.get('jobFunctions', [])
-            formatted_job_functions = job_data.get('formattedJobFunctions', [])
-            applies = job_data.get('applies')
-            views = job_data.get('views')
-            new = job_data.get('new')
-            sponsored = job_data.get('sponsored')
-            created_at = job_data.get('createdAt')
-            
-            # MEDIUM FIELDS - Dict/List Extraction (5 fields)
-            # Job description (nested text)
-            description = ''
-            if 'description' in job_data and isinstance(job_data['description'], dict):
-                description = job_data['description'].get('text', '')
-            
-            # Salary insights (dict)
-            salary_insights = job_data.get('salaryInsights', {})
-            job_compensation_available = salary_insights.get('jobCompensationAvailable')
-            
-            # Company description (nested text)
-            company_description = ''
-            if 'companyDescription' in job_data and isinstance(job_data['companyDescription'], dict):
-                company_description = job_data['companyDescription'].get('text', '')
-            
-            # Formatted creation date
-            created_at_formatted = None
-            if created_at:
-                try:
-                    created_at_formatted = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc).isoformat()
-                except (ValueError, TypeError):
-                    created_at_formatted = None
-            
-            return {
-                # Original fields (7)
-                'job_id': job_id,
-                'title': title,
-                'company_name': company_name,
-                'posted_dt': posted_dt,
-                'is_repost': is_repost,
-                'url': apply_url,
-                'source': 'api',
-                
-                # Enhanced fields (26)
-                # Skills & Education
-                'skills_description': skills_description,
-                'education_description': education_description,
-                
-                # Salary & Compensation
-                'formatted_salary_description': formatted_salary_description,
-                'salary_insights': salary_insights,
-                'job_compensation_available': job_compensation_available,
-                
-                # Company Information
-                'company_description': company_description,
-                'industries': industries,
-                'formatted_industries': formatted_industries,
-                'source_domain': source_domain,
-                
-                # Location & Remote Work
-                'formatted_location': formatted_location,
-                'work_remote_allowed': work_remote_allowed,
-                'workplace_types': workplace_types,
-                
-                # Benefits & Perks
-                'benefits': benefits,
-                'brief_benefits_description': brief_benefits_description,
-                'inferred_benefits': inferred_benefits,
-                
-                # Job Details & Type
-                'employment_status': employment_status,
-                'formatted_employment_status': formatted_employment_status,
-                'job_functions': job_functions,
-                'formatted_job_functions': formatted_job_functions,
-                
-                # Metrics & Statistics
-                'applies': applies,
-                'views': views,
-                'new': new,
-                'sponsored': sponsored,
-                
-                # Job Content
-                'description': description,
-                
-                # Timing
-                'created_at': created_at,
-                'created_at_formatted': created_at_formatted,
-
-                # Company Tier (quick score — no web calls)
-                'company_tier': get_company_tier(company_name) if company_name != 'N/A' else 'T5_UNRANKED',
-            }
-    except:
-        pass
+        status, data = await fetch_json(http, url, rate_limiter, item_path='data')
+        if status == 200 and data:
+            return parse_job_details(job_id, data)
+    except Exception as e:
+        logger.debug("   ⚠️ Job %s details failed: %s", job_id, e)
+
+    return None
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """One scraped job. Slots keep tens of thousands of in-flight records compact;
+    orjson serializes it directly and to_dict() is used where a plain dict is needed."""
+    # Original fields (7)
+    job_id: str
+    title: str
+    company_name: Optional[str]
+    posted_dt: Optional[str]
+    is_repost: bool
+    url: str
+    source: str
+    
+    # Enhanced fields (26)
+    # Skills & Education
+    skills_description: Any
+    education_description: Any
+    
+    # Salary & Compensation
+    formatted_salary_description: Any
+    salary_insights: Any
+    job_compensation_available: Any
+    
+    # Company Information
+    company_description: str
+    industries: Any
+    formatted_industries: Any
+    source_domain: Any
+    
+    # Location & Remote Work
+    formatted_location: Any
+    work_remote_allowed: Any
+    workplace_types: Any
+    
+    # Benefits & Perks
+    benefits: Any
+    brief_benefits_description: Any
+    inferred_benefits: Any
+    
+    # Job Details & Type
+    employment_status: Any
+    formatted_employment_status: Any
+    job_functions: Any
+    formatted_job_functions: Any
+    
+    # Metrics & Statistics
+    applies: Any
+    views: Any
+    new: Any
+    sponsored: Any
+    
+    # Job Content
+    description: Any
+    
+    # Timing
+    created_at: Any
+    created_at_formatted: Optional[str]
+    
+    # Company Tier (quick score — no web calls)
+    company_tier: str
+    
+    # Shard info, stamped on when the job is merged into the run
+    shard_key: Optional[str] = None
+    exp_level: Optional[str] = None
+    job_type: Optional[str] = None
+    workplace_type: Optional[str] = None
+    filters: Optional[str] = None
+    experience_level: Optional[str] = None
+    job_type_label: Optional[str] = None
+    workplace_type_label: Optional[str] = None
+    
+    def update(self, fields):
+        """Set several fields at once (dict.update counterpart)"""
+        for name, value in fields.items():
+            setattr(self, name, value)
+    
+    def to_dict(self):
+        """Plain dict in field order, for code that stores or mutates job dicts"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
+@functools.lru_cache(maxsize=4096)
+def _company_from_url_path(url_path):
+    """Company name from a URL path like "junior-legal-specialist-at-robin-ai-4289326695", or None"""
+    parts = url_path.split('-at-')
+    if len(parts) > 1:
+        company_part = parts[1].split('-')[:-1]  # Remove the job ID at the end
+        return ' '.join(company_part).title() or None
     return None
 
 
+@functools.lru_cache(maxsize=8192)
+def _iso_from_ms(timestamp_ms):
+    """UTC ISO-8601 string for an epoch-milliseconds timestamp (shards re-observe the same postings)"""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).isoformat()
+
+
+def parse_job_details(job_id, job_data):
+    """Flatten a Voyager jobPosting payload into a JobRecord"""
+    title = job_data.get('title', 'N/A')
+    
+    # Enhanced repost detection using timestamp comparison
+    listed_at = job_data.get('listedAt')
+    original_listed_at = job_data.get('originalListedAt')
+    
+    # Use timestamp comparison for accurate repost detection
+    if listed_at and original_listed_at:
+        is_repost = (listed_at != original_listed_at)
+    else:
+        # Fallback to repostedJobPosting field if timestamps unavailable
+        is_repost = job_data.get('repostedJobPosting', False)
+        if is_repost is None:
+            is_repost = False
+    
+    # Extract posting date
+    posted_dt = None
+    for date_field in ['timeAt', 'listedAt', 'postedAt']:
+        if date_field in job_data:
+            timestamp = job_data[date_field]
+            if isinstance(timestamp, (int, float)):
+                posted_dt = _iso_from_ms(timestamp)
+                break
+    
+    # Extract company name from URL path segment
+    company_name = _company_from_url_path(job_data.get('urlPathSegment') or '')
+    
+    # Fallback: try companyDetails if URL extraction fails
+    if company_name is None and 'companyDetails' in job_data:
+        company_details = job_data['companyDetails']
+        if 'companyName' in company_details:
+            company_name = company_details['companyName']
+        elif 'company' in company_details and isinstance(company_details['company'], dict):
+            company_name = company_details['company'].get('name')
+    
+    # Extract apply URL (prefer companyApplyUrl if available)
+    apply_url = f'https://www.linkedin.com/jobs/view/{job_id}/'
+    if 'applyMethod' in job_data:
+        apply_method = job_data['applyMethod']
+        if 'companyApplyUrl' in apply_method:
+            apply_url = apply_method['companyApplyUrl']
+    
+    # ===== ENHANCED FIELD EXTRACTION =====
+    
+    # EASY FIELDS - Direct Access (21 fields)
+    skills_description = job_data.get('skillsDescription')
+    education_description = job_data.get('educationDescription')
+    formatted_salary_description = job_data.get('formattedSalaryDescription')
+    industries = job_data.get('industries', [])
+    formatted_industries = job_data.get('formattedIndustries', [])
+    source_domain = job_data.get('sourceDomain')
+    formatted_location = job_data.get('formattedLocation')
+    work_remote_allowed = job_data.get('workRemoteAllowed')
+    workplace_types = job_data.get('workplaceTypes', [])
+    benefits = job_data.get('benefits', [])
+    brief_benefits_description = job_data.get('briefBenefitsDescription')
+    inferred_benefits = job_data.get('inferredBenefits', [])
+    employment_status = job_data.get('employmentStatus')
+    formatted_employment_status = job_data.get('formattedEmploymentStatus')
+    job_functions = job_data.get('jobFunctions', [])
+    formatted_job_functions = job_data.get('formattedJobFunctions', [])
+    applies = job_data.get('applies')
+    views = job_data.get('views')
+    new = job_data.get('new')
+    sponsored = job_data.get('sponsored')
+    created_at = job_data.get('createdAt')
+    
+    # MEDIUM FIELDS - Dict/List Extraction (5 fields)
+    # Job description (nested text)
+    description = ''
+    if 'description' in job_data and isinstance(job_data['description'], dict):
+        description = job_data['description'].get('text', '')
+    
+    # Salary insights (dict)
+    salary_insights = job_data.get('salaryInsights', {})
+    job_compensation_available = salary_insights.get('jobCompensationAvailable')
+    
+    # Company description (nested text)
+    company_description = ''
+    if 'companyDescription' in job_data and isinstance(job_data['companyDescription'], dict):
+        company_description = job_data['companyDescription'].get('text', '')
+    
+    # Formatted creation date
+    created_at_formatted = None
+    if created_at:
+        try:
+            created_at_formatted = _iso_from_ms(created_at)
+        except (ValueError, TypeError):
+            created_at_formatted = None
+    
+    return JobRecord(
+        # Original fields (7)
+        job_id=job_id,
+        title=title,
+        company_name=company_name,
+        posted_dt=posted_dt,
+        is_repost=is_repost,
+        url=apply_url,
+        source='api',
+        
+        # Enhanced fields (26)
+        # Skills & Education
+        skills_description=skills_description,
+        education_description=education_description,
+        
+        # Salary & Compensation
+        formatted_salary_description=formatted_salary_description,
+        salary_insights=salary_insights,
+        job_compensation_available=job_compensation_available,
+        
+        # Company Information
+        company_description=company_description,
+        industries=industries,
+        formatted_industries=formatted_industries,
+        source_domain=source_domain,
+        
+        # Location & Remote Work
+        formatted_location=formatted_location,
+        work_remote_allowed=work_remote_allowed,
+        workplace_types=workplace_types,
+        
+        # Benefits & Perks
+        benefits=benefits,
+        brief_benefits_description=brief_benefits_description,
+        inferred_benefits=inferred_benefits,
+        
+        # Job Details & Type
+        employment_status=employment_status,
+        formatted_employment_status=formatted_employment_status,
+        job_functions=job_functions,
+        formatted_job_functions=formatted_job_functions,
+        
+        # Metrics & Statistics
+        applies=applies,
+        views=views,
+        new=new,
+        sponsored=sponsored,
+        
+        # Job Content
+        description=description,
+        
+        # Timing
+        created_at=created_at,
+        created_at_formatted=created_at_formatted,
+
+        # Company Tier (quick score — no web calls)
+        company_tier=get_company_tier(company_name) if company_name else 'T5_UNRANKED',
+    )
+
+
+@functools.lru_cache(maxsize=8192)
 def is_blacklisted(company_name):
-    """Check if company is blacklisted"""
-    if not company_name or company_name == 'N/A':
+    """Check if company is blacklisted (memoized: the same companies recur across cards and shards)"""
+    if not company_name:
         return False
-    return bool(BLACKLIST_RE.search(company_name))
+    name = company_name.lower()
+    return any(blocked in name for blocked in BLACKLIST_COMPANIES)
+
+async def scrape_shard_api_only(http, keywords, exp_level, job_type, workplace_type, shard_num, total_shards, time_filter='r604800',
+                                claimed_ids=None, rate_limiter=None):
+    """Scrape a single shard using API only
 
-def scrape_shard_api_only(session, keywords, exp_level, job_type, workplace_type, shard_num, total_shards, time_filter='r604800'):
-    """Scrape a single shard using API only"""
+    Returns (new_jobs, repeat_ids): freshly fetched jobs, plus IDs already claimed by other shards.
+    """
     
     exp_label = EXP_LABEL.get(exp_level, exp_level)
     jt_label = JT_LABEL.get(job_type, job_type) 
     wt_label = WT_LABEL.get(workplace_type, workplace_type)
     
-    print(f"\n📋 Shard {shard_num}/{total_shards}: {exp_label} + {jt_label} + {wt_label}")
+    logger.info(f"\n📋 Shard {shard_num}/{total_shards}: {exp_label} + {jt_label} + {wt_label}")
     # Use API only
-    print(f"   🔍 Fetching jobs via API...")
-    api_jobs = get_jobs_api(session, keywords, exp_level, job_type, workplace_type, time_filter=time_filter)
+    logger.debug("   🔍 Fetching jobs via API...")
+    repeat_ids = []
+    api_jobs = await get_jobs_api(http, keywords, exp_level, job_type, workplace_type, time_filter=time_filter,
+                                  claimed_ids=claimed_ids, repeat_ids=repeat_ids, rate_limiter=rate_limiter)
     
-    if api_jobs:
-        print(f"   ✅ API success: {len(api_jobs)} jobs")
-        return api_jobs
+    if api_jobs or repeat_ids:
+        logger.info(f"   ✅ API success: {len(api_jobs)} new jobs, {len(repeat_ids)} already seen in other shards")
+        return api_jobs, repeat_ids
     else:
-        print(f"   📭 No jobs found for this shard")
-        return []
+        logger.info(f"   📭 No jobs found for this shard")
+        return [], []
+
+def _json_default(obj):
+    """Fallback serializer for orjson (sets become lists, anything else a string)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+def write_jobs_json(path, jobs):
+    """Write jobs as a JSON array one record at a time, so the whole file is never built in memory"""
+    with open(path, 'wb') as f:
+        f.write(b'[\n')
+        for i, job in enumerate(jobs):
+            if i:
+                f.write(b',\n')
+            f.write(orjson.dumps(job, default=_json_default, option=orjson.OPT_INDENT_2))
+        f.write(b'\n]\n')
+
+# Resume data: every shard's jobs are appended as JSON lines, shard bookkeeping lives in a small meta file
+PROGRESS_JOBS_FILE = '/tmp/scraping_progress.jsonl'  #tmp is only writable by the lambda function
+PROGRESS_META_FILE = '/tmp/scraping_progress_meta.json'
 
-def save_progress(all_jobs, shard_results, shard_mappings, completed_shards):
-    """Save progress to allow resuming later"""
-    progress_data = {
-        'all_jobs': all_jobs,
+def append_progress_jobs(f, shard_jobs, repeat_ids=(), shard_key=None, labels=None):
+    """Append one shard's jobs (and stub lines for jobs other shards fetched) to the open JSONL progress file"""
+    lines = [orjson.dumps(job, default=_json_default) for job in shard_jobs]
+    lines.extend(orjson.dumps({'job_id': job_id, 'shard_key': shard_key, 'filters': labels, 'repeat': True})
+                 for job_id in repeat_ids)
+    if lines:
+        f.write(b'\n'.join(lines) + b'\n')
+
+def save_progress(shard_results, completed_shards):
+    """Save shard bookkeeping to allow resuming later (jobs are already on disk as JSONL)"""
+    progress_meta = {
         'shard_results': shard_results,
-        'shard_mappings': shard_mappings,
         'completed_shards': completed_shards,
         'timestamp': datetime.now().isoformat()
     }
     
-    with open('/tmp/scraping_progress.json', 'w') as f: #tmp is only writable by the lambda function
-        json.dump(progress_data, f, indent=2, default=str)
+    with open(PROGRESS_META_FILE, 'wb') as f:
+        f.write(orjson.dumps(progress_meta, default=_json_default))
 
 def load_progress():
-    """Load progress from previous run"""
+    """Load progress from previous run, rebuilding jobs and shard mappings from the JSONL file
+
+    Shard mappings come back keyed by shard (job_id -> {shard_key: mapping}), as
+    scrape_all_shards_api_only keeps them until its final result.
+    """
     try:
-        with open('/tmp/scraping_progress.json', 'r') as f:
-            progress_data = json.load(f)
-        
-        # Convert job IDs back to strings if needed
-        all_jobs = progress_data['all_jobs']
-        shard_results = progress_data['shard_results']
-        shard_mappings = progress_data['shard_mappings']
-        completed_shards = set(progress_data['completed_shards'])
-        
-        return all_jobs, shard_results, shard_mappings, completed_shards
+        with open(PROGRESS_META_FILE, 'rb') as f:
+            progress_meta = orjson.loads(f.read())
     except FileNotFoundError:
         return [], {}, {}, set()
+    
+    shard_results = progress_meta['shard_results']
+    completed_shards = set(progress_meta['completed_shards'])
+    all_jobs, shard_mappings, seen_job_ids = [], {}, set()
+    
+    try:
+        with open(PROGRESS_JOBS_FILE, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    job = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # Partial line from an interrupted write
+                shard_key = job.get('shard_key')
+                # Shards finished after the last meta save are scraped again
+                if shard_key not in completed_shards:
+                    continue
+                
+                job_id = job['job_id']
+                shard_mappings.setdefault(job_id, {})[shard_key] = {
+                    'shard_key': shard_key,
+                    'shard_num': shard_results[shard_key].get('shard_num'),
+                    'labels': job.get('filters')
+                }
+                if not job.get('repeat') and job_id not in seen_job_ids:
+                    seen_job_ids.add(job_id)
+                    all_jobs.append(JobRecord(**job))
+    except FileNotFoundError:
+        pass
+    
+    return all_jobs, shard_results, shard_mappings, completed_shards
 
 def scrape_all_shards_api_only(keywords, max_shards=None, resume=False, time_filter='r604800', 
                               exp_codes=EXP_CODES, jt_codes=JT_CODES, wt_codes=WT_CODES,
                               batch_size=18, batch_number=1):
     """Scrape all shard combinations using API only"""
-    print("🚀 Starting LinkedIn Scraper (API-Only)")
+    logger.info("🚀 Starting LinkedIn Scraper (API-Only)")
     
     # Load progress if resuming
     if resume:
         all_jobs, shard_results, shard_mappings, completed_shards = load_progress()
         if completed_shards:
-            print(f"📊 Resuming from previous run: {len(completed_shards)} shards completed")
+            logger.info(f"📊 Resuming from previous run: {len(completed_shards)} shards completed")
         else:
-            print(f"📊 No previous progress found, starting fresh")
+            logger.info(f"📊 No previous progress found, starting fresh")
             all_jobs, shard_results, shard_mappings, completed_shards = [], {}, {}, set()
     else:
         all_jobs, shard_results, shard_mappings, completed_shards = [], {}, {}, set()
@@ -543,7 +1001,7 @@ def scrape_all_shards_api_only(keywords, max_shards=None, resume=False, time_fil
     
     # Validate session before proceeding
     if not api_session:
-        print("❌ Failed to setup API session. Cannot proceed with scraping.")
+        logger.info("❌ Failed to setup API session. Cannot proceed with scraping.")
         return [], {}, {}
     
     # Initialize adaptive rate limiter
@@ -552,18 +1010,18 @@ def scrape_all_shards_api_only(keywords, max_shards=None, resume=False, time_fil
     # Load shard priorities for optimal ordering
     priority_shards = load_shard_priorities()
     if priority_shards:
-        print(f"📊 Using historical shard priorities for optimal ordering")
+        logger.info(f"📊 Using historical shard priorities for optimal ordering")
     else:
-        print(f"📊 No historical data found, using default shard order")
+        logger.info(f"📊 No historical data found, using default shard order")
     
     # Generate prioritized shard combinations
     shard_combinations = generate_prioritized_shards(priority_shards)
     
     # Apply parameter filters
-    print(f"🔍 Using parameter filters:")
-    print(f"   - Experience codes: {exp_codes}")
-    print(f"   - Job type codes: {jt_codes}")
-    print(f"   - Workplace type codes: {wt_codes}")
+    logger.info(f"🔍 Using parameter filters:")
+    logger.info(f"   - Experience codes: {exp_codes}")
+    logger.info(f"   - Job type codes: {jt_codes}")
+    logger.info(f"   - Workplace type codes: {wt_codes}")
     
     # Filter shard combinations
     filtered_combinations = []
@@ -579,105 +1037,117 @@ def scrape_all_shards_api_only(keywords, max_shards=None, resume=False, time_fil
         filtered_combinations.append((exp_level, jt_type, wt_type))
     
     shard_combinations = filtered_combinations
-    print(f"   ✅ Filtered to {len(shard_combinations)} relevant shards")
+    logger.info(f"   ✅ Filtered to {len(shard_combinations)} relevant shards")
     
     # Apply batch processing for Lambda compatibility
     if batch_size and batch_number:
         start_idx = (batch_number - 1) * batch_size
         end_idx = start_idx + batch_size
         shard_combinations = shard_combinations[start_idx:end_idx]
-        print(f"📦 Batch processing: batch {batch_number} (shards {start_idx+1}-{min(end_idx, len(filtered_combinations))})")
+        logger.info(f"📦 Batch processing: batch {batch_number} (shards {start_idx+1}-{min(end_idx, len(filtered_combinations))})")
     
     # Initialize tracking with efficient data structures
-    seen_job_ids = {job['job_id'] for job in all_jobs}  # Efficient deduplication set
-    shard_num = 0
+    seen_job_ids = {job.job_id for job in all_jobs}  # Efficient deduplication set
+    claimed_ids = set(seen_job_ids)  # IDs some shard has fetched or is fetching; shared by all shards
     total_possible = len(shard_combinations)
     
-    print(f"📊 Processing up to {max_shards or total_possible} shards (of {total_possible} total combinations)")
+    logger.info(f"📊 Processing up to {max_shards or total_possible} shards (of {total_possible} total combinations)")
     
-    for exp_level, job_type, workplace_type in shard_combinations:
-        shard_num += 1
-        
+    # Number each shard up front; skip completed ones and anything past max_shards
+    pending_shards = []
+    for shard_num, (exp_level, job_type, workplace_type) in enumerate(shard_combinations, start=1):
         if max_shards and shard_num > max_shards:
-            print(f"\n🔚 Reached max shards limit: {max_shards}")
+            logger.info(f"\n🔚 Reached max shards limit: {max_shards}")
             break
         
-        # Skip if already completed
         shard_key = f"{exp_level}_{job_type}_{workplace_type}"
         if shard_key in completed_shards:
-            print(f"   ⏭️ Skipping completed shard {shard_num}: {shard_key}")
+            logger.debug("   ⏭️ Skipping completed shard %s: %s", shard_num, shard_key)
             continue
+        pending_shards.append((shard_num, exp_level, job_type, workplace_type))
+    
+    async def run_shard(http, shard_semaphore, shard_num, exp_level, job_type, workplace_type):
+        """Scrape one shard while holding a concurrency slot (requests are paced by rate_limiter)"""
+        async with shard_semaphore:
+            shard_jobs, repeat_ids = await scrape_shard_api_only(http, keywords, exp_level, job_type, workplace_type, shard_num,
+                                                                 max_shards or total_possible, time_filter, claimed_ids,
+                                                                 rate_limiter)
         
-        # Scrape this shard
-        start_time = time.time()
-        shard_jobs = scrape_shard_api_only(api_session, keywords, exp_level, job_type, workplace_type, shard_num, max_shards or total_possible, time_filter)
-        response_time = time.time() - start_time
-        
-        # Record performance for rate limiting
-        if shard_jobs:
-            rate_limiter.record_success(response_time)
-        else:
-            rate_limiter.record_error()
-        
-        # Track results
-        shard_results[shard_key] = {
-            'exp_level': exp_level,
-            'job_type': job_type,
-            'workplace_type': workplace_type,
-            'job_count': len(shard_jobs),
-            'labels': f"{EXP_LABEL[exp_level]}+{JT_LABEL[job_type]}+{WT_LABEL[workplace_type]}"
-        }
-        
-        # Efficient deduplication and tracking
-        new_jobs_count = 0
-        for job in shard_jobs:
-            job_id = job['job_id']
-            
-            # Add shard info directly to job
-            job['shard_key'] = shard_key
-            job['exp_level'] = exp_level
-            job['job_type'] = job_type
-            job['workplace_type'] = workplace_type
-            job['filters'] = shard_results[shard_key]['labels']
-            
-            # Add human-readable filter labels for API filtering
-            job['experience_level'] = EXP_LABEL.get(exp_level, 'unknown')
-            job['job_type_label'] = JT_LABEL.get(job_type, 'unknown')
-            job['workplace_type_label'] = WT_LABEL.get(workplace_type, 'unknown')
-            
-            # Track shard mappings (for backward compatibility)
-            if job_id not in shard_mappings:
-                shard_mappings[job_id] = []
-            shard_mappings[job_id].append({
-                'shard_key': shard_key,
-                'shard_num': shard_num,
-                'labels': shard_results[shard_key]['labels']
-            })
+        return shard_num, exp_level, job_type, workplace_type, shard_jobs, repeat_ids
+    
+    async def run_all_shards():
+        shard_semaphore = asyncio.Semaphore(SHARD_CONCURRENCY)
+        async with make_async_session(api_session, CONCURRENT_WORKERS * SHARD_CONCURRENCY) as http:
+            with open(PROGRESS_JOBS_FILE, 'ab' if resume else 'wb') as progress_jobs:
+                tasks = [run_shard(http, shard_semaphore, *shard) for shard in pending_shards]
+                shards_done = 0
             
-            # Efficient deduplication
-            if job_id not in seen_job_ids:
-                seen_job_ids.add(job_id)
-                all_jobs.append(job)
-                new_jobs_count += 1
-        
-        # Mark shard as completed
-        completed_shards.add(shard_key)
-        
-        print(f"   📊 Added {new_jobs_count} new jobs (total: {len(all_jobs)})")
-        
-        # Save progress periodically
-        if shard_num % 10 == 0:
-            save_progress(all_jobs, shard_results, shard_mappings, list(completed_shards))
-            print(f"   💾 Progress saved at shard {shard_num}")
-        
-        # Adaptive rate limiting
-        if shard_num % BREAK_INTERVAL == 0:  # Longer break every N shards
-            wait_time = rate_limiter.get_break_delay()
-            print(f"   ⏳ Taking longer break ({wait_time:.1f}s)...")
-        else:
-            wait_time = rate_limiter.get_delay()
-        
-        time.sleep(wait_time)
+                # Merge each shard as soon as it finishes so progress saves stay incremental
+                for finished in asyncio.as_completed(tasks):
+                    shard_num, exp_level, job_type, workplace_type, shard_jobs, repeat_ids = await finished
+                    shard_key = f"{exp_level}_{job_type}_{workplace_type}"
+                
+                    # Track results
+                    shard_results[shard_key] = {
+                        'exp_level': exp_level,
+                        'job_type': job_type,
+                        'workplace_type': workplace_type,
+                        'job_count': len(shard_jobs) + len(repeat_ids),
+                        'shard_num': shard_num,
+                        'labels': f"{EXP_LABEL[exp_level]}+{JT_LABEL[job_type]}+{WT_LABEL[workplace_type]}"
+                    }
+                
+                    # Shard fields shared by every job in this shard, built once
+                    labels = shard_results[shard_key]['labels']
+                    shard_info = {
+                        'shard_key': shard_key,
+                        'exp_level': exp_level,
+                        'job_type': job_type,
+                        'workplace_type': workplace_type,
+                        'filters': labels,
+                        # Human-readable filter labels for API filtering
+                        'experience_level': EXP_LABEL.get(exp_level, 'unknown'),
+                        'job_type_label': JT_LABEL.get(job_type, 'unknown'),
+                        'workplace_type_label': WT_LABEL.get(workplace_type, 'unknown'),
+                    }
+                    # Shard mapping entry (for backward compatibility); read-only, so shared across jobs
+                    shard_mapping = {'shard_key': shard_key, 'shard_num': shard_num, 'labels': labels}
+                
+                    # Efficient deduplication and tracking
+                    new_jobs_count = 0
+                    for job in shard_jobs:
+                        job_id = job.job_id
+                        job.update(shard_info)
+                        shard_mappings.setdefault(job_id, {})[shard_key] = shard_mapping
+                        
+                        if job_id not in seen_job_ids:
+                            seen_job_ids.add(job_id)
+                            all_jobs.append(job)
+                            new_jobs_count += 1
+                    
+                    # Jobs another shard fetched only gain this shard's mapping
+                    for job_id in repeat_ids:
+                        shard_mappings.setdefault(job_id, {})[shard_key] = shard_mapping
+                
+                    # Persist this shard's jobs and mark it completed
+                    append_progress_jobs(progress_jobs, shard_jobs, repeat_ids, shard_key, labels)
+                    completed_shards.add(shard_key)
+                    shards_done += 1
+                
+                    logger.info(f"   📊 Shard {shard_num}: added {new_jobs_count} new jobs (total: {len(all_jobs)})")
+                
+                    # Save progress periodically
+                    if shards_done % 10 == 0:
+                        progress_jobs.flush()
+                        save_progress(shard_results, list(completed_shards))
+                        logger.info(f"   💾 Progress saved after {shards_done} shards")
+    
+    asyncio.run(run_all_shards())
+    
+    # Flatten to job_id -> [mapping, ...] (one entry per shard); repeats of jobs whose
+    # first fetch failed or was blacklisted have no record to map to
+    shard_mappings = {job_id: list(by_shard.values()) for job_id, by_shard in shard_mappings.items()
+                      if job_id in seen_job_ids}
     
     return all_jobs, shard_results, shard_mappings
 
@@ -727,24 +1197,25 @@ def main():
     
     # Set time filter based on mode
     if args.mode == 'daily':
-        print("📊 Daily mode: Recent jobs (last 24 hours)")
+        logger.info("📊 Daily mode: Recent jobs (last 24 hours)")
         time_filter = 'r86400'  # Last 24 hours
     else:
-        print("📊 Weekly mode: Broader time range (last week)")
+        logger.info("📊 Weekly mode: Broader time range (last week)")
         time_filter = 'r604800'  # Last week
     
     # Clear previous data files
     import os
     json_file = '/tmp/linkedin_jobs_simplified.json'
-    progress_file = '/tmp/scraping_progress.json'
+    progress_files = [PROGRESS_JOBS_FILE, PROGRESS_META_FILE]
     
-    print("🗑️ Clearing previous data files...")
+    logger.info("🗑️ Clearing previous data files...")
     if os.path.exists(json_file):
         os.remove(json_file)
-        print(f"   ✅ Removed {json_file}")
-    if os.path.exists(progress_file) and not args.resume:
-        os.remove(progress_file)
-        print(f"   ✅ Removed {progress_file}")
+        logger.info(f"   ✅ Removed {json_file}")
+    for progress_file in progress_files:
+        if os.path.exists(progress_file) and not args.resume:
+            os.remove(progress_file)
+            logger.info(f"   ✅ Removed {progress_file}")
     
     # Run scraper with options
     all_jobs, shard_results, shard_mappings = scrape_all_shards_api_only(
@@ -755,33 +1226,32 @@ def main():
     )
     
     # Save results
-    with open('/tmp/linkedin_jobs_simplified.json', 'w') as f:
-        json.dump(all_jobs, f, indent=2, default=str)
+    write_jobs_json('/tmp/linkedin_jobs_simplified.json', all_jobs)
     
     # Note: shard_lookup.json was removed during cleanup
     # Shard information is now embedded directly in each job
     
     # Show summary
-    print(f"\n📊 Final Results:")
-    print(f"   Total unique jobs: {len(all_jobs)}")
-    print(f"   API jobs: {len([j for j in all_jobs if j['source'] == 'api'])}")
-    print(f"   Jobs with titles: {len([j for j in all_jobs if j['title'] != 'N/A'])}")
-    print(f"   Jobs with dates: {len([j for j in all_jobs if j['posted_dt']])}")
-    print(f"   Reposts: {len([j for j in all_jobs if j['is_repost']])}")
-    print(f"   Shards processed: {len(shard_results)}")
+    logger.info(f"\n📊 Final Results:")
+    logger.info(f"   Total unique jobs: {len(all_jobs)}")
+    logger.info(f"   API jobs: {len([j for j in all_jobs if j.source == 'api'])}")
+    logger.info(f"   Jobs with titles: {len([j for j in all_jobs if j.title != 'N/A'])}")
+    logger.info(f"   Jobs with dates: {len([j for j in all_jobs if j.posted_dt])}")
+    logger.info(f"   Reposts: {len([j for j in all_jobs if j.is_repost])}")
+    logger.info(f"   Shards processed: {len(shard_results)}")
     
     # Show top productive shards
     productive_shards = sorted(shard_results.items(), key=lambda x: x[1]['job_count'], reverse=True)
-    print(f"\n🏆 Top Productive Shards:")
+    logger.info(f"\n🏆 Top Productive Shards:")
     for i, (shard_key, data) in enumerate(productive_shards[:3]):
-        print(f"   {i+1}. {data['labels']}: {data['job_count']} jobs")
+        logger.info(f"   {i+1}. {data['labels']}: {data['job_count']} jobs")
 
     # Show company tier distribution
     tier_counts = defaultdict(int)
     for job in all_jobs:
-        tier_counts[job.get('company_tier', 'T5_UNRANKED')] += 1
+        tier_counts[job.company_tier] += 1
     if tier_counts:
-        print(f"\n🏢 Company Tier Distribution:")
+        logger.info(f"\n🏢 Company Tier Distribution:")
         tier_order = ['T1_ELITE', 'T2_PREMIUM', 'T3_STRONG', 'T4_STANDARD', 'T5_UNRANKED']
         tier_names = {'T1_ELITE': 'Elite', 'T2_PREMIUM': 'Premium', 'T3_STRONG': 'Strong',
                       'T4_STANDARD': 'Standard', 'T5_UNRANKED': 'Unranked'}
@@ -789,12 +1259,12 @@ def main():
             count = tier_counts.get(tier, 0)
             if count > 0:
                 pct = count / len(all_jobs) * 100
-                print(f"   {tier_names.get(tier, tier)}: {count} jobs ({pct:.1f}%)")
+                logger.info(f"   {tier_names.get(tier, tier)}: {count} jobs ({pct:.1f}%)")
 
-    print(f"\n💾 Saved to:")
-    print(f"   - /tmp/linkedin_jobs_simplified.json (jobs with shard info)")
+    logger.info(f"\n💾 Saved to:")
+    logger.info(f"   - /tmp/linkedin_jobs_simplified.json (jobs with shard info)")
     if args.resume:
-        print(f"   - /tmp/scraping_progress.json (resume data)")
+        logger.info(f"   - {PROGRESS_JOBS_FILE} + {PROGRESS_META_FILE} (resume data)")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,7 +3,8 @@
 Simple LinkedIn login script.
 """
 
-import pickle
+import atexit
+import json
 import time
 import re
 import subprocess
@@ -36,28 +37,31 @@ def detect_chrome_version():
     print("⚠️ Could not detect Chrome version, letting undetected_chromedriver auto-detect")
     return None
 
-def login_and_save_cookies(email, password):
-    """Login to LinkedIn and save cookies"""
+def save_cookies(cookies, path='li_cookies.json'):
+    """Write cookies atomically so a crash mid-write never leaves a truncated file behind"""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'cookies': cookies}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# Browser reused across logins in this process (Chrome startup dominates login time)
+_DRIVER = None
+
+def _create_driver():
+    """Start undetected Chrome with the scraper's options"""
     # Import browser deps here — these are not available in Lambda
     import undetected_chromedriver as uc
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
 
-    print("🔐 Logging into LinkedIn...")
-
-    # Setup browser with optimized options (same as scraper)
+    # Setup browser with a minimal flag set (site isolation and the Viz compositor stay on;
+    # images are skipped via blink-settings since Chrome ignores --disable-images)
     options = uc.ChromeOptions()
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-gpu')
-    options.add_argument('--disable-images')
-    options.add_argument('--disable-plugins')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-browser-side-navigation')
-    options.add_argument('--disable-site-isolation-trials')
-    options.add_argument('--disable-web-security')
-    options.add_argument('--disable-features=VizDisplayCompositor')
+    options.add_argument('--blink-settings=imagesEnabled=false')
     
     # Check if we're in Docker or GitHub Actions
     if os.path.exists('/.dockerenv') or os.getenv('GITHUB_ACTIONS'):
@@ -70,15 +74,7 @@ def login_and_save_cookies(email, password):
             options.binary_location = '/usr/bin/chromium-browser'
         elif os.path.exists('/usr/bin/chromium'):
             options.binary_location = '/usr/bin/chromium'
-        options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
-        options.add_argument('--disable-web-security')
-        options.add_argument('--disable-features=VizDisplayCompositor')
+        options.add_argument('--headless=new')
         options.add_argument('--remote-debugging-port=9222')
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
@@ -90,12 +86,49 @@ def login_and_save_cookies(email, password):
         try:
             print(f"🔄 Attempt {attempt + 1}/{max_retries} to create browser...")
             driver = uc.Chrome(options=options, version_main=chrome_version)
+            # Reuse one HTTP connection to chromedriver for every WebDriver command
+            driver.command_executor.keep_alive = True
             break
         except Exception as e:
             print(f"⚠️ Browser creation attempt {attempt + 1} failed: {e}")
             if attempt == max_retries - 1:
                 raise
             time.sleep(2)
+    return driver
+
+def get_driver():
+    """Return the cached browser, starting one on first use"""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = _create_driver()
+    return _DRIVER
+
+def close_driver():
+    """Quit the cached browser, if any"""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+atexit.register(close_driver)
+
+def login_and_save_cookies(email, password, driver=None):
+    """Login to LinkedIn and save cookies
+
+    Uses `driver` if given, otherwise the cached browser from get_driver(); the
+    browser is left running for the next call (see close_driver()).
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    print("🔐 Logging into LinkedIn...")
+    
+    if driver is None:
+        driver = get_driver()
     
     try:
         # Go to LinkedIn login
@@ -104,66 +137,95 @@ def login_and_save_cookies(email, password):
         # Wait a bit to appear more human-like
         time.sleep(2)
         
-        # Wait for login form and enter credentials
-        email_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = driver.find_element(By.ID, "password")
+        if 'linkedin.com/feed' in driver.current_url:
+            # A reused browser that is still signed in gets redirected; just re-save its cookies
+            print("✅ Browser session still logged in")
+        else:
+            # Wait for login form and enter credentials (poll every 100ms instead of the default 500ms)
+            email_field = WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.ID, "username"))
+            )
+            password_field = driver.find_element(By.ID, "password")
         
-        # Type more human-like (with delays)
-        for char in email:
-            email_field.send_keys(char)
-            time.sleep(0.1)
+            # One WebDriver command per field (per-character typing cost a round-trip per keystroke)
+            email_field.send_keys(email)
         
-        time.sleep(1)
+            time.sleep(1)
         
-        for char in password:
-            password_field.send_keys(char)
-            time.sleep(0.1)
+            password_field.send_keys(password)
         
-        time.sleep(2)
+            time.sleep(2)
         
-        # Click login button
-        login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-        login_button.click()
-        time.sleep(30)
+            # Click login button
+            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            login_button.click()
         
-        # Wait for successful login (with multiple possible success indicators)
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='Search']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test-id='search-input']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".global-nav__me")),
-                    EC.url_contains("linkedin.com/feed")
+            # Wait for successful login (with multiple possible success indicators); returns as soon as one appears
+            try:
+                WebDriverWait(driver, 45, poll_frequency=0.1).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='Search']")),
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test-id='search-input']")),
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ".global-nav__me")),
+                        EC.url_contains("linkedin.com/feed")
+                    )
                 )
-            )
-        except Exception as e:
-            print(f"⚠️ Login verification failed: {e}")
-            # Check if we're on a 2FA page
-            if "challenge" in driver.current_url or "two-factor" in driver.current_url:
-                print("🔐 2FA detected - manual intervention may be required")
-                raise Exception("2FA challenge detected - cannot proceed automatically")
-            raise
+            except Exception as e:
+                print(f"⚠️ Login verification failed: {e}")
+                # Check if we're on a 2FA page
+                if "challenge" in driver.current_url or "two-factor" in driver.current_url:
+                    print("🔐 2FA detected - manual intervention may be required")
+                    raise Exception("2FA challenge detected - cannot proceed automatically")
+                raise
         
         print("✅ Login successful!")
         
         # Save cookies
         cookies = driver.get_cookies()
-        with open('li_cookies.pkl', 'wb') as f:
-            pickle.dump(cookies, f)
+        save_cookies(cookies)
         
-        print("💾 Cookies saved to li_cookies.pkl")
+        print("💾 Cookies saved to li_cookies.json")
         
     except Exception as e:
         print(f"❌ Login failed: {e}")
+        # Don't hand a browser in an unknown state to the next login
+        if driver is _DRIVER:
+            close_driver()
         raise
-    finally:
-        driver.quit()
+
+def saved_cookies_valid(path='li_cookies.json'):
+    """Check whether saved cookies still open the feed (one GET instead of a browser login)"""
+    if not os.path.exists(path):
+        return False
+    
+    import requests
+    
+    try:
+        with open(path) as f:
+            cookies = json.load(f)['cookies']
+        
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        })
+        for c in cookies:
+            session.cookies.set(c['name'], c['value'], domain=c.get('domain', '.linkedin.com'), path=c.get('path', '/'))
+        
+        # An expired session is redirected to the login/auth wall instead of the feed
+        resp = session.get('https://www.linkedin.com/feed/', allow_redirects=True, timeout=15)
+        return resp.status_code == 200 and '/feed' in resp.url and 'login' not in resp.url
+    except Exception as e:
+        print(f"⚠️ Could not verify saved cookies: {e}")
+        return False
 
 def main():
     print("🔐 LinkedIn Login")
     
+    if saved_cookies_valid():
+        print("✅ Saved cookies in li_cookies.json are still valid, skipping login")
+        return
+    
     # Get credentials
     email = os.getenv('LINKEDIN_EMAIL')
     password = os.getenv('LINKEDIN_PASSWORD')
@@ -178,6 +240,8 @@ def main():
         print("✅ Login successful!")
     except Exception as e:
         print(f"❌ Login failed: {e}")
+    finally:
+        close_driver()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file